@@ -0,0 +1,23 @@
+"""Shared pytest configuration for the modern and legacy test suites."""
+
+import sys
+
+import pytest
+
+try:  # optional libuv event loop; the stdlib selector loop is the fallback
+    import uvloop
+except ImportError:
+    uvloop = None
+
+
+if uvloop is not None and sys.platform != "win32":
+
+    def pytest_asyncio_loop_factories(config, item):
+        """Run async tests on uvloop when it is installed."""
+        return {"uvloop": uvloop.new_event_loop}
+
+
+@pytest.fixture
+def temp_persist_path(tmp_path):
+    """Path for board persistence inside the test's own temp directory."""
+    return tmp_path / "board.json"
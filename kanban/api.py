@@ -25,12 +25,15 @@ from __future__ import annotations
 
 import asyncio
 import os
+import weakref
 from contextlib import asynccontextmanager
+from pathlib import Path
 from typing import Annotated
 
 from fastapi import Depends, FastAPI, HTTPException, Query
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
+from .assistants import close_claude_client
 from .board import AsyncKanbanBoard, stale_task_monitor
 from .domain import (
     AuditEntry,
@@ -53,12 +56,16 @@ _board: AsyncKanbanBoard | None = None
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     global _board
-    _board = AsyncKanbanBoard()
 
     # Environment config
+    persist_path = Path(
+        os.getenv("BOARD_PERSIST_PATH", AsyncKanbanBoard.DEFAULT_PERSIST_PATH)
+    )
     stale_threshold = int(os.getenv("STALE_THRESHOLD_SECONDS", "300"))
     poll_interval = int(os.getenv("MONITOR_POLL_SECONDS", "60"))
 
+    _board = AsyncKanbanBoard(persist_path=persist_path)
+
     # Start background monitor
     monitor_task = asyncio.create_task(
         stale_task_monitor(_board, stale_threshold, poll_interval)
@@ -72,6 +79,9 @@ async def lifespan(app: FastAPI):
         await monitor_task
     except asyncio.CancelledError:
         pass
+    await _board.flush()
+    _response_caches.pop(_board, None)
+    await close_claude_client()
 
 
 def get_board() -> AsyncKanbanBoard:
@@ -124,6 +134,8 @@ class AuditEntryResponse(BaseModel):
         note: Optional free-text note (e.g., rejection reason).
     """
 
+    model_config = ConfigDict(frozen=True)
+
     from_stage: Stage | None
     to_stage: Stage
     timestamp: str
@@ -131,7 +143,8 @@ class AuditEntryResponse(BaseModel):
 
     @classmethod
     def from_entry(cls, entry: AuditEntry) -> "AuditEntryResponse":
-        return cls(
+        # Domain objects are already valid — skip Pydantic validation.
+        return cls.model_construct(
             from_stage=entry.from_stage,
             to_stage=entry.to_stage,
             timestamp=entry.timestamp,
@@ -156,6 +169,9 @@ class TaskResponse(BaseModel):
         retry_count: Number of times task has been rejected.
     """
 
+    # Frozen: from_task hands the same cached instance to every request
+    model_config = ConfigDict(frozen=True)
+
     id: str
     title: str
     description: str
@@ -168,19 +184,53 @@ class TaskResponse(BaseModel):
     retry_count: int
 
     @classmethod
-    def from_task(cls, task: Task) -> "TaskResponse":
-        return cls(
+    def from_task(
+        cls, task: Task, cache: dict[str, tuple[int, TaskResponse]] | None = None
+    ) -> "TaskResponse":
+        """
+        Build the response for ``task``, reusing ``cache`` when given.
+
+        Args:
+            task: The domain task to serialise.
+            cache: Per-board map of task id → (version, response); see
+                ``_cache_for``. A hit needs the task's current version.
+        """
+        if cache is not None:
+            cached = cache.get(task.id)
+            if cached and cached[0] == task.version:
+                return cached[1]
+        # Domain objects are already valid — skip Pydantic validation.
+        response = cls.model_construct(
             id=task.id,
             title=task.title,
             description=task.description,
             stage=task.stage,
             created_at=task.created_at,
             code_snippet=task.code_snippet,
-            depends_on=task.depends_on,
+            depends_on=list(task.depends_on),
             history=[AuditEntryResponse.from_entry(e) for e in task.history],
             review_notes=task.review_notes,
             retry_count=task.retry_count,
         )
+        if cache is not None:
+            cache[task.id] = (task.version, response)
+        return response
+
+
+# Board → {task id → (version, response)}, so an idle board is served without
+# rebuilding models. Scoped per board so boards sharing a task id never see
+# each other's entries; weak keys drop a board's cache along with the board.
+_response_caches: weakref.WeakKeyDictionary[
+    AsyncKanbanBoard, dict[str, tuple[int, TaskResponse]]
+] = weakref.WeakKeyDictionary()
+
+
+def _cache_for(board: AsyncKanbanBoard) -> dict[str, tuple[int, TaskResponse]]:
+    """Return ``board``'s response cache, creating it on first use."""
+    cache = _response_caches.get(board)
+    if cache is None:
+        cache = _response_caches[board] = {}
+    return cache
 
 
 class BoardSnapshot(BaseModel):
@@ -194,6 +244,8 @@ class BoardSnapshot(BaseModel):
         done: List of tasks in DONE stage.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     backlog: list[TaskResponse]
     in_progress: list[TaskResponse]
     review: list[TaskResponse]
@@ -244,7 +296,7 @@ async def create_task(body: CreateTaskRequest, board: BoardDep) -> TaskResponse:
         )
     except BoardError as exc:
         raise _http(exc)
-    return TaskResponse.from_task(task)
+    return TaskResponse.from_task(task, _cache_for(board))
 
 
 @app.get("/tasks", response_model=list[TaskResponse])
@@ -253,13 +305,14 @@ def list_tasks(
     stage: Stage | None = Query(default=None, description="Filter by stage"),
 ) -> list[TaskResponse]:
     tasks = board.tasks_by_stage(stage) if stage else board.all_tasks()
-    return [TaskResponse.from_task(t) for t in tasks]
+    cache = _cache_for(board)
+    return [TaskResponse.from_task(t, cache) for t in tasks]
 
 
 @app.get("/tasks/{task_id}", response_model=TaskResponse)
 def get_task(task_id: str, board: BoardDep) -> TaskResponse:
     try:
-        return TaskResponse.from_task(board.get_task(task_id))
+        return TaskResponse.from_task(board.get_task(task_id), _cache_for(board))
     except TaskNotFoundError as exc:
         raise _http(exc)
 
@@ -270,7 +323,7 @@ async def start_task(task_id: str, board: BoardDep) -> TaskResponse:
         task = await board.move_to_in_progress(task_id)
     except BoardError as exc:
         raise _http(exc)
-    return TaskResponse.from_task(task)
+    return TaskResponse.from_task(task, _cache_for(board))
 
 
 @app.post("/tasks/{task_id}/review", response_model=TaskResponse)
@@ -279,7 +332,7 @@ async def review_task(task_id: str, board: BoardDep) -> TaskResponse:
         task = await board.move_to_review(task_id)
     except BoardError as exc:
         raise _http(exc)
-    return TaskResponse.from_task(task)
+    return TaskResponse.from_task(task, _cache_for(board))
 
 
 @app.post("/tasks/{task_id}/approve", response_model=TaskResponse)
@@ -288,7 +341,7 @@ async def approve_task(task_id: str, board: BoardDep) -> TaskResponse:
         task = await board.approve(task_id)
     except BoardError as exc:
         raise _http(exc)
-    return TaskResponse.from_task(task)
+    return TaskResponse.from_task(task, _cache_for(board))
 
 
 @app.post("/tasks/{task_id}/reject", response_model=TaskResponse)
@@ -314,18 +367,16 @@ async def reject_task(
         task = await board.reject(task_id, body.reason)
     except BoardError as exc:
         raise _http(exc)
-    return TaskResponse.from_task(task)
+    return TaskResponse.from_task(task, _cache_for(board))
 
 
 @app.get("/board", response_model=BoardSnapshot)
 def board_view(board: BoardDep) -> BoardSnapshot:
-    return BoardSnapshot(
-        backlog=[
-            TaskResponse.from_task(t) for t in board.tasks_by_stage(Stage.BACKLOG)
-        ],
-        in_progress=[
-            TaskResponse.from_task(t) for t in board.tasks_by_stage(Stage.IN_PROGRESS)
-        ],
-        review=[TaskResponse.from_task(t) for t in board.tasks_by_stage(Stage.REVIEW)],
-        done=[TaskResponse.from_task(t) for t in board.tasks_by_stage(Stage.DONE)],
+    cache = _cache_for(board)
+    # BoardSnapshot's fields are named after Stage values
+    return BoardSnapshot.model_construct(
+        **{
+            stage.value: [TaskResponse.from_task(t, cache) for t in tasks]
+            for stage, tasks in board.snapshot().items()
+        }
     )
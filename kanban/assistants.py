@@ -6,11 +6,16 @@ An assistant is any async callable with signature:
 
 Swap the assistant injected into AsyncKanbanBoard to change behaviour
 without touching any board logic.
+
+``AsyncBatcher`` wraps a batch function ``async (list[str]) -> list[str]``
+into such an assistant, so concurrent starts share one upstream request.
 """
 
 from __future__ import annotations
 
 import asyncio
+import json
+import weakref
 from typing import Any, Callable, Coroutine
 
 from loguru import logger
@@ -20,6 +25,13 @@ AsyncCodingAssistant = Callable[[str], Coroutine[Any, Any, str]]
 
 AsyncReviewerAssistant = Callable[[str, str], Coroutine[Any, Any, str]]
 
+AsyncBatchAssistant = Callable[[list[str]], Coroutine[Any, Any, list[str]]]
+
+_SNIPPET_INSTRUCTIONS = (
+    "You are a coding assistant on a Kanban board.\n"
+    "Generate a minimal Python code snippet (skeleton + docstring) "
+)
+
 
 async def async_mock_assistant(description: str) -> str:
     """Simulates network latency — no real API call."""
@@ -36,6 +48,60 @@ async def async_mock_assistant(description: str) -> str:
 
 async def async_claude_assistant(description: str) -> str:
     """Calls the real Anthropic async API to generate a code snippet."""
+    logger.debug("Claude async API: generating snippet…")
+    return await _claude_complete(
+        _SNIPPET_INSTRUCTIONS
+        + "for the following task. Return only the code, no explanation.\n\n"
+        + f"Task description:\n{description}",
+        max_tokens=512,
+    )
+
+
+async def async_claude_batch_assistant(descriptions: list[str]) -> list[str]:
+    """
+    Generates snippets for several tasks in a single Anthropic request.
+
+    Falls back to one request per task if the reply is not a JSON array of
+    exactly ``len(descriptions)`` strings.
+    """
+    if len(descriptions) == 1:
+        return [await async_claude_assistant(descriptions[0])]
+
+    logger.debug("Claude async API: generating {} snippets…", len(descriptions))
+    tasks = "\n\n".join(
+        f"Task {i} description:\n{d}" for i, d in enumerate(descriptions, 1)
+    )
+    text = await _claude_complete(
+        _SNIPPET_INSTRUCTIONS
+        + f"for each of the following {len(descriptions)} tasks. Return only a "
+        "JSON array of code strings, one per task in the same order, "
+        "no explanation.\n\n" + tasks,
+        max_tokens=512 * len(descriptions),
+    )
+    try:
+        snippets = json.loads(text)
+    except ValueError:
+        snippets = None
+    if (
+        isinstance(snippets, list)
+        and len(snippets) == len(descriptions)
+        and all(isinstance(s, str) for s in snippets)
+    ):
+        return snippets
+
+    logger.warning("Batched reply unusable — retrying tasks one by one")
+    return list(await asyncio.gather(*map(async_claude_assistant, descriptions)))
+
+
+# One client per event loop. Each AsyncAnthropic owns an HTTP connection
+# pool, so reusing it saves a TCP + TLS handshake per call; pools are bound
+# to the loop they were created on, hence the per-loop key.
+_clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Any] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _claude_client() -> Any:
     try:
         from anthropic import AsyncAnthropic
     except ImportError as exc:
@@ -43,26 +109,127 @@ async def async_claude_assistant(description: str) -> str:
             "Run `pip install anthropic` to use the real assistant."
         ) from exc
 
-    client = AsyncAnthropic()
-    logger.debug("Claude async API: generating snippet…")
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None:
+        client = _clients[loop] = AsyncAnthropic()
+    return client
+
+
+async def close_claude_client() -> None:
+    """Close the running loop's shared Anthropic client, if one was opened."""
+    client = _clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.close()
+
+
+async def _claude_complete(prompt: str, max_tokens: int) -> str:
+    client = _claude_client()
     message = await client.messages.create(
         model="claude-opus-4-6",
-        max_tokens=512,
-        messages=[
-            {
-                "role": "user",
-                "content": (
-                    "You are a coding assistant on a Kanban board.\n"
-                    "Generate a minimal Python code snippet (skeleton + docstring) "
-                    "for the following task. Return only the code, no explanation.\n\n"
-                    f"Task description:\n{description}"
-                ),
-            }
-        ],
+        max_tokens=max_tokens,
+        messages=[{"role": "user", "content": prompt}],
     )
     return message.content[0].text
 
 
+class _LoopBatch:
+    """An ``AsyncBatcher``'s pending calls and batch tasks on one event loop."""
+
+    __slots__ = ("calls", "timer", "running")
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, asyncio.Future[str]]] = []
+        self.timer: asyncio.TimerHandle | None = None
+        self.running: set[asyncio.Task] = set()
+
+
+class AsyncBatcher:
+    """
+    Coalesces concurrent single-description calls into batched calls.
+
+    Calls that arrive within ``max_wait_ms`` of the first pending one are
+    handed to ``batch_fn`` together (at most ``max_batch`` per call) and each
+    caller gets its own result back. An instance is itself an
+    ``AsyncCodingAssistant``, so it can be injected into the board as-is.
+    Pending calls are kept per event loop, so one instance can outlive the
+    loops that use it.
+
+    Args:
+        batch_fn:    ``async (list[str]) -> list[str]``, results in input order.
+        max_batch:   Dispatch immediately once this many calls are pending.
+        max_wait_ms: Longest a call waits for companions before dispatch.
+    """
+
+    def __init__(
+        self,
+        batch_fn: AsyncBatchAssistant,
+        max_batch: int = 8,
+        max_wait_ms: float = 50,
+    ) -> None:
+        self._batch_fn = batch_fn
+        self._max_batch = max_batch
+        self._max_wait = max_wait_ms / 1000
+        self._batches: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, _LoopBatch
+        ] = weakref.WeakKeyDictionary()
+
+    async def __call__(self, description: str) -> str:
+        loop = asyncio.get_running_loop()
+        batch = self._batches.get(loop)
+        if batch is None:
+            # A loop closed with calls pending is kept alive by its own
+            # futures and timer, so weak keys alone never drop it.
+            for closed in [lp for lp in self._batches if lp.is_closed()]:
+                del self._batches[closed]
+            batch = self._batches[loop] = _LoopBatch()
+        future: asyncio.Future[str] = loop.create_future()
+        batch.calls.append((description, future))
+        if len(batch.calls) >= self._max_batch:
+            self._dispatch(batch)
+        elif batch.timer is None:
+            batch.timer = loop.call_later(self._max_wait, self._dispatch, batch)
+        return await future
+
+    def _dispatch(self, batch: _LoopBatch) -> None:
+        if batch.timer is not None:
+            batch.timer.cancel()
+            batch.timer = None
+        calls, batch.calls = batch.calls, []
+        if calls:
+            task = asyncio.ensure_future(self._run(calls))
+            batch.running.add(task)
+            task.add_done_callback(batch.running.discard)
+
+    async def _run(self, batch: list[tuple[str, asyncio.Future[str]]]) -> None:
+        try:
+            results = await self._batch_fn([d for d, _ in batch])
+            if len(results) != len(batch):
+                raise ValueError(
+                    f"Batch function returned {len(results)} results "
+                    f"for {len(batch)} inputs."
+                )
+        except Exception as exc:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+        except BaseException:
+            # Cancelled (or the loop is going away): never leave a caller
+            # waiting on a future nothing will resolve.
+            for _, future in batch:
+                future.cancel()
+            raise
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+
+# Drop-in replacement for async_claude_assistant that shares requests
+# between tasks started at about the same time.
+batched_claude_assistant = AsyncBatcher(async_claude_batch_assistant)
+
+
 async def async_mock_reviewer(description: str, snippet: str) -> str:
     """Simulates a reviewer that checks the generated code."""
     logger.debug("Mock reviewer: analysing {!r}…", description[:50])
@@ -7,17 +7,25 @@ Responsibilities:
   - Reject transition (Review → Backlog) with retry tracking
   - WIP limit (max concurrent In-Progress tasks)
   - Dependency resolution (hard-block on unfinished deps)
-  - JSON persistence (sync, fine at this scale)
+  - JSON persistence (snapshot + journal, written off the event loop)
 
 The board is the only place that mutates task state. All public methods
-are async and protected by a single asyncio.Lock.
+are async. asyncio is single-threaded, so a check-then-mutate section with
+no ``await`` inside it is already atomic and board-wide invariants (WIP
+count, stage index) need no lock. Each task has its own asyncio.Lock, held
+for the whole of an operation on that task — including the assistant
+await — so operations on one task are serialised while different tasks
+move in parallel. Hooks fire after the task lock is released; the reviewer
+runs after move_to_review's hook and retakes the lock only to store its notes.
 """
 
 from __future__ import annotations
 
 import asyncio
-import json
-from dataclasses import asdict
+import sys
+import time
+from collections import defaultdict, deque
+from datetime import datetime
 from pathlib import Path
 
 from loguru import logger
@@ -28,6 +36,7 @@ from .assistants import (
     async_mock_assistant,
 )
 from .domain import (
+    HISTORY_LIMIT,
     AuditEntry,
     InvalidTransitionError,
     Stage,
@@ -35,8 +44,15 @@ from .domain import (
     TaskNotFoundError,
     UnresolvedDependencyError,
     WIPLimitError,
+    utc_now,
 )
 from .hooks import AsyncHookFn, HookRegistry
+from .persistence import JournalStore
+
+# Section headings for board_view, built once rather than on every print.
+_STAGE_HEADINGS = {stage: stage.value.upper() for stage in Stage}
+# Plain dict lookup for _load, skipping Enum's call machinery per field.
+_STAGE_BY_VALUE = {stage.value: stage for stage in Stage}
 
 
 class AsyncKanbanBoard:
@@ -44,8 +60,13 @@ class AsyncKanbanBoard:
     Args:
         assistant:    Any async callable ``(str) -> str``.
         wip_limit:    Max tasks allowed in In-Progress simultaneously.
-        persist_path: If given, board state is saved after every mutation.
-                      Pass ``None`` to disable persistence (useful in tests).
+        persist_path: If given, board state is saved after every mutation
+                      (see ``JournalStore``). Pass ``None`` to disable
+                      persistence (useful in tests).
+        persist_debounce_ms: Delay non-durable writes by this long so a run
+                      of mutations lands in one write. ``0`` (default)
+                      writes before each mutation returns. Call ``flush()``
+                      to write pending changes early (e.g. at shutdown).
     """
 
     DEFAULT_PERSIST_PATH = Path("board.json")
@@ -57,12 +78,34 @@ class AsyncKanbanBoard:
         persist_path: Path | None = DEFAULT_PERSIST_PATH,
         hooks: dict[str, list[AsyncHookFn]] | None = None,
         reviewer: AsyncReviewerAssistant | None = None,
+        persist_debounce_ms: int = 0,
     ) -> None:
         self._tasks: dict[str, Task] = {}
+        # Per-stage index kept in lock-step with ``Task.stage`` so WIP checks
+        # and stage listings never scan every task.
+        self._by_stage: dict[Stage, dict[str, Task]] = {s: {} for s in Stage}
+        # Reverse dependency index (dep id → ids of tasks waiting on it) and
+        # each task's count of dependencies not yet Done, so the dependency
+        # check is a single lookup instead of a walk over ``depends_on``.
+        self._dependents: defaultdict[str, list[str]] = defaultdict(list)
+        self._unresolved: dict[str, int] = {}
+        # Backlog tasks with no unresolved dependencies (dict as an ordered set)
+        self._ready: dict[str, None] = {}
         self._assistant = assistant
         self._wip_limit = wip_limit
         self._persist_path = persist_path
-        self._lock = asyncio.Lock()
+        self._store = JournalStore(persist_path) if persist_path else None
+        # asyncio.Lock.acquire() already takes a free lock synchronously — no
+        # Future, no trip through the event loop — so uncontended operations
+        # need no hand-rolled try-lock fast path.
+        self._task_locks: defaultdict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+        self._persist_lock = asyncio.Lock()
+        # Ids of tasks changed since the last flush (dict as an ordered set)
+        self._dirty: dict[str, None] = {}
+        self._durable = False  # some pending change asked for an fsync
+        self._debounce = persist_debounce_ms / 1000
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._flush_task: asyncio.Task | None = None
         self._hook_registry = HookRegistry()
         self._reviewer = reviewer
         if hooks:
@@ -70,8 +113,8 @@ class AsyncKanbanBoard:
                 for hook in hook_list:
                     self._hook_registry.register(event, hook)
 
-        if persist_path and persist_path.exists():
-            self._load(persist_path)
+        if self._store and self._store.exists():
+            self._load()
             logger.info("Board loaded from {}", persist_path)
 
     # ------------------------------------------------------------------
@@ -95,19 +138,28 @@ class AsyncKanbanBoard:
             TaskNotFoundError: If any dependency ID does not exist.
         """
         deps = depends_on or []
-        async with self._lock:
-            # Validate all dependency IDs exist before creating the task
-            for dep_id in deps:
-                if dep_id not in self._tasks:
-                    raise TaskNotFoundError(dep_id)
-            task = Task(title=title, description=description, depends_on=deps)
-            self._record(task, from_stage=None, to_stage=Stage.BACKLOG, note="created")
-            self._tasks[task.id] = task
-            self._save()
+        # Validate all dependency IDs exist before creating the task
+        for dep_id in deps:
+            if dep_id not in self._tasks:
+                raise TaskNotFoundError(dep_id)
+        task = Task(title=title, description=description, depends_on=deps)
+        self._record(
+            task,
+            from_stage=None,
+            to_stage=Stage.BACKLOG,
+            note="created",
+            timestamp=task.created_at,
+        )
+        self._tasks[task.id] = task
+        self._by_stage[Stage.BACKLOG][task.id] = task
+        self._index_dependencies(task)
+        self._save(task)
+        await self._persist()
 
         dep_info = f" (depends on {deps})" if deps else ""
         logger.info("Created  {} — {!r}{}", task.id, title, dep_info)
-        await self._fire_hook("on_transition", task)
+        if self._hook_registry.has("on_transition"):
+            await self._fire_hook("on_transition", task)
         return task
 
     async def move_to_in_progress(self, task_id: str) -> Task:
@@ -120,8 +172,8 @@ class AsyncKanbanBoard:
             WIPLimitError:             In-Progress count would exceed wip_limit.
             UnresolvedDependencyError: One or more dependencies are not Done.
         """
-        async with self._lock:
-            task = self._get(task_id)
+        task = self._get(task_id)
+        async with self._task_locks[task_id]:
             self._assert_stage(task, Stage.BACKLOG)
             self._check_dependencies(task)
 
@@ -130,61 +182,71 @@ class AsyncKanbanBoard:
                 raise WIPLimitError(current=wip_count, limit=self._wip_limit)
 
             # Commit stage immediately so concurrent callers see the updated count
-            task.stage = Stage.IN_PROGRESS
+            self._set_stage(task, Stage.IN_PROGRESS)
             self._record(task, from_stage=Stage.BACKLOG, to_stage=Stage.IN_PROGRESS)
-            self._save()
-
-        logger.info(
-            "Task {}  →  in_progress  (wip {}/{})",
-            task_id,
-            wip_count + 1,
-            self._wip_limit,
-        )
+            self._save(task)
+            await self._persist()
+
+            logger.info(
+                "Task {}  →  in_progress  (wip {}/{})",
+                task_id,
+                wip_count + 1,
+                self._wip_limit,
+            )
 
-        # Run assistant OUTSIDE the lock — pure I/O, no shared state mutation
-        logger.info("Coding assistant analysing task {}…", task_id)
-        snippet = await self._assistant(task.description)
+            # Only this task's lock is held — other tasks keep moving meanwhile
+            logger.info("Coding assistant analysing task {}…", task_id)
+            snippet = await self._assistant(task.description)
 
-        async with self._lock:
             task.code_snippet = snippet
-            self._save()
+            self._save(task)
+            await self._persist()
 
         logger.success("Coding assistant done for task {}", task_id)
-        await self._fire_hook("on_transition", task)
+        if self._hook_registry.has("on_transition"):
+            await self._fire_hook("on_transition", task)
         return task
 
     async def move_to_review(self, task_id: str) -> Task:
-        async with self._lock:
-            task = self._get(task_id)
+        task = self._get(task_id)
+        async with self._task_locks[task_id]:
             self._assert_stage(task, Stage.IN_PROGRESS)
-            task.stage = Stage.REVIEW
+            self._set_stage(task, Stage.REVIEW)
             self._record(task, from_stage=Stage.IN_PROGRESS, to_stage=Stage.REVIEW)
-            self._save()
+            self._save(task)
+            await self._persist()
 
-        await self._fire_hook("on_transition", task)
+        if self._hook_registry.has("on_transition"):
+            await self._fire_hook("on_transition", task)
 
+        # The reviewer runs after the lock is released and the hook has fired
         if self._reviewer:
             logger.info("Reviewer analysing task {}…", task_id)
             notes = await self._reviewer(task.description, task.code_snippet or "")
 
-            async with self._lock:
+            async with self._task_locks[task_id]:
                 task.review_notes = notes
-                self._save()
+                self._save(task)
+                await self._persist()
 
             logger.success("Reviewer done for task {}", task_id)
 
         return task
 
     async def approve(self, task_id: str) -> Task:
-        async with self._lock:
-            task = self._get(task_id)
+        task = self._get(task_id)
+        async with self._task_locks[task_id]:
             self._assert_stage(task, Stage.REVIEW)
-            task.stage = Stage.DONE
+            self._set_stage(task, Stage.DONE)
+            self._resolve_dependents(task_id)
             self._record(task, from_stage=Stage.REVIEW, to_stage=Stage.DONE)
-            self._save()
+            self._save(task, durable=True)
+            await self._persist()
         logger.success("Task {}  →  done  ✓", task_id)
-        await self._fire_hook("on_transition", task)
-        await self._fire_hook("on_done", task)
+        if self._hook_registry.has("on_transition"):
+            await self._fire_hook("on_transition", task)
+        if self._hook_registry.has("on_done"):
+            await self._fire_hook("on_done", task)
         return task
 
     async def reject(self, task_id: str, reason: str) -> Task:
@@ -202,18 +264,20 @@ class AsyncKanbanBoard:
             TaskNotFoundError:      Task does not exist.
             InvalidTransitionError: Task is not in REVIEW stage.
         """
-        async with self._lock:
-            task = self._get(task_id)
+        task = self._get(task_id)
+        async with self._task_locks[task_id]:
             self._assert_stage(task, Stage.REVIEW)
-            task.stage = Stage.BACKLOG
+            self._set_stage(task, Stage.BACKLOG)
             task.retry_count += 1
             self._record(
                 task, from_stage=Stage.REVIEW, to_stage=Stage.BACKLOG, note=reason
             )
-            self._save()
+            self._save(task, durable=True)
+            await self._persist()
 
         logger.info("Task {} rejected → backlog (reason: {})", task_id, reason[:50])
-        await self._fire_hook("on_rejected", task)
+        if self._hook_registry.has("on_rejected"):
+            await self._fire_hook("on_rejected", task)
         return task
 
     def get_task(self, task_id: str) -> Task:
@@ -224,16 +288,31 @@ class AsyncKanbanBoard:
         return list(self._tasks.values())
 
     def tasks_by_stage(self, stage: Stage) -> list[Task]:
-        return [t for t in self._tasks.values() if t.stage == stage]
+        return list(self._by_stage[stage].values())
+
+    def ready_tasks(self) -> list[Task]:
+        """
+        Backlog tasks whose dependencies are all Done, oldest first.
+
+        Maintained incrementally (Kahn-style), so schedulers can pick work
+        without retrying move_to_in_progress against blocked tasks. The WIP
+        limit still applies when a ready task is moved.
+        """
+        return [self._tasks[tid] for tid in self._ready]
+
+    def snapshot(self) -> dict[Stage, list[Task]]:
+        """All tasks grouped by stage, read straight off the stage index."""
+        return {stage: list(tasks.values()) for stage, tasks in self._by_stage.items()}
 
     def board_view(self) -> None:
-        """Prints a snapshot grouped by stage."""
+        """Prints a snapshot grouped by stage, in a single write."""
+        lines = []
         for stage in Stage:
-            tasks = self.tasks_by_stage(stage)
-            cap = f"{self._wip_limit}" if stage == Stage.IN_PROGRESS else "∞"
-            print(f"\n── {stage.value.upper()} ({len(tasks)}/{cap}) ──")
-            for t in tasks:
-                print(" ", t)
+            tasks = self._by_stage[stage].values()
+            cap = f"{self._wip_limit}" if stage is Stage.IN_PROGRESS else "∞"
+            lines.append(f"\n── {_STAGE_HEADINGS[stage]} ({len(tasks)}/{cap}) ──")
+            lines.extend(f"  {t}" for t in tasks)
+        print("\n".join(lines))
 
     def find_stale(self, threshold_seconds: int = 300) -> list[Task]:
         """
@@ -245,28 +324,19 @@ class AsyncKanbanBoard:
         Returns:
             List of tasks that have been in IN_PROGRESS longer than threshold.
         """
-        from datetime import datetime, timezone
-
-        cutoff = datetime.now(timezone.utc).timestamp() - threshold_seconds
-        stale = []
-
-        for task in self._tasks.values():
-            if task.stage != Stage.IN_PROGRESS:
-                continue
-
-            # Find the most recent transition to IN_PROGRESS
-            transition_time = None
-            for entry in reversed(task.history):
-                if entry.to_stage == Stage.IN_PROGRESS:
-                    transition_time = datetime.fromisoformat(
-                        entry.timestamp
-                    ).timestamp()
-                    break
-
-            if transition_time and transition_time < cutoff:
-                stale.append(task)
+        cutoff = time.time() - threshold_seconds
+        return [
+            task
+            for task in self._by_stage[Stage.IN_PROGRESS].values()
+            if task.in_progress_since is not None and task.in_progress_since < cutoff
+        ]
 
-        return stale
+    async def flush(self) -> None:
+        """Write any changes still waiting out ``persist_debounce_ms``."""
+        if self._flush_handle:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        await self._flush()
 
     async def _fire_hook(self, event: str, task: Task) -> None:
         """Fire hooks for the given event. Errors are caught and logged."""
@@ -282,64 +352,211 @@ class AsyncKanbanBoard:
         from_stage: Stage | None,
         to_stage: Stage,
         note: str | None = None,
+        timestamp: str | None = None,
     ) -> None:
-        """Append an AuditEntry to the task's history. Must be called inside the lock."""
-        entry = AuditEntry(from_stage=from_stage, to_stage=to_stage, note=note)
+        """Append an AuditEntry to the task's history. Must not straddle an await."""
+        entry = AuditEntry(
+            from_stage=from_stage,
+            to_stage=to_stage,
+            timestamp=timestamp or utc_now(),
+            note=note,
+        )
         task.history.append(entry)
-        logger.debug("Audit [{}] {} → {}", task.id, from_stage, to_stage)
 
     def _get(self, task_id: str) -> Task:
-        if task_id not in self._tasks:
+        task = self._tasks.get(task_id)
+        if task is None:
             raise TaskNotFoundError(task_id)
-        return self._tasks[task_id]
+        return task
+
+    def _set_stage(self, task: Task, stage: Stage) -> None:
+        """Move a task to ``stage``, keeping the per-stage index in sync."""
+        del self._by_stage[task.stage][task.id]
+        self._ready.pop(task.id, None)
+        task.stage = stage
+        task.in_progress_since = time.time() if stage is Stage.IN_PROGRESS else None
+        self._by_stage[stage][task.id] = task
+        if stage is Stage.BACKLOG and not self._unresolved[task.id]:
+            self._ready[task.id] = None
 
     def _count_stage(self, stage: Stage) -> int:
-        return sum(1 for t in self._tasks.values() if t.stage == stage)
+        return len(self._by_stage[stage])
 
     @staticmethod
     def _assert_stage(task: Task, expected: Stage) -> None:
-        if task.stage != expected:
+        if task.stage is not expected:
             raise InvalidTransitionError(task.id, task.stage, expected)
 
     def _check_dependencies(self, task: Task) -> None:
         """Raises UnresolvedDependencyError if any dependency is not Done."""
+        if not self._unresolved[task.id]:
+            return
         blocking = [
             dep_id
             for dep_id in task.depends_on
-            if dep_id in self._tasks and self._tasks[dep_id].stage != Stage.DONE
+            if dep_id in self._tasks and self._tasks[dep_id].stage is not Stage.DONE
         ]
-        if blocking:
-            raise UnresolvedDependencyError(task.id, blocking)
+        raise UnresolvedDependencyError(task.id, blocking)
+
+    def _index_dependencies(self, task: Task) -> None:
+        """Register ``task`` with the reverse index of its unfinished deps."""
+        unresolved = 0
+        for dep_id in task.depends_on:
+            dep = self._tasks.get(dep_id)
+            if dep is not None and dep.stage is not Stage.DONE:
+                self._dependents[dep_id].append(task.id)
+                unresolved += 1
+        self._unresolved[task.id] = unresolved
+        if task.stage is Stage.BACKLOG and not unresolved:
+            self._ready[task.id] = None
+
+    def _resolve_dependents(self, task_id: str) -> None:
+        """``task_id`` reached Done: release the tasks that waited on it."""
+        for dependent_id in self._dependents.pop(task_id, ()):
+            self._unresolved[dependent_id] -= 1
+            if not self._unresolved[dependent_id]:
+                self._ready[dependent_id] = None
+
+    def _save(self, task: Task, durable: bool = False) -> None:
+        """
+        Record that ``task`` changed. The actual write happens in ``_flush``.
+
+        Pass ``durable=True`` for changes that must survive a crash; the
+        next flush then fsyncs the journal.
+        """
+        task.version += 1
+        if self._store:
+            self._dirty[task.id] = None
+            self._durable = self._durable or durable
+
+    async def _persist(self) -> None:
+        """
+        Write pending changes now, or after the debounce delay.
 
-    def _save(self) -> None:
-        if not self._persist_path:
+        Durable changes are always written before returning, taking any
+        debounced ones with them; others restart the debounce timer.
+        """
+        if not self._dirty:
+            return
+        if not self._debounce or self._durable:
+            await self.flush()
             return
-        data = {tid: asdict(t) for tid, t in self._tasks.items()}
-        self._persist_path.write_text(json.dumps(data, indent=2))
-        logger.debug("Persisted → {}", self._persist_path)
+        if self._flush_handle:
+            self._flush_handle.cancel()
+        self._flush_handle = asyncio.get_running_loop().call_later(
+            self._debounce, self._start_debounced_flush
+        )
 
-    def _load(self, path: Path) -> None:
-        data = json.loads(path.read_text())
+    def _start_debounced_flush(self) -> None:
+        self._flush_handle = None
+        self._flush_task = asyncio.create_task(self._flush())
+        self._flush_task.add_done_callback(_log_flush_error)
+
+    async def _flush(self) -> None:
+        """
+        Write pending changes to disk, outside any critical section.
+
+        Changed tasks are copied to plain dicts on the event loop (so they
+        are consistent) and appended to the journal from a worker thread;
+        every ``compact_every`` records the whole board is snapshotted
+        instead. Callers that arrive while a write is in flight queue on
+        ``_persist_lock``; the first one through writes everything
+        accumulated so far and the rest find nothing left to do, so a burst
+        of N mutations costs at most two writes.
+        """
+        if not self._store:
+            return
+        async with self._persist_lock:
+            if not self._dirty:
+                return
+            dirty, self._dirty = self._dirty, {}
+            durable, self._durable = self._durable, False
+            try:
+                if self._store.should_compact:
+                    data = {tid: t.to_dict() for tid, t in self._tasks.items()}
+                    await asyncio.to_thread(self._store.compact, data)
+                else:
+                    records = [self._tasks[tid].to_dict() for tid in dirty]
+                    await asyncio.to_thread(self._store.append, records, durable)
+            except BaseException:
+                self._dirty = dirty | self._dirty
+                self._durable = self._durable or durable
+                raise
+        logger.debug("Persisted {} task(s) → {}", len(dirty), self._persist_path)
+
+    def _load(self) -> None:
+        data = self._store.load()
         for tid, raw in data.items():
-            raw["stage"] = Stage(raw["stage"])
-            raw["history"] = [
-                AuditEntry(
-                    from_stage=Stage(e["from_stage"]) if e["from_stage"] else None,
-                    to_stage=Stage(e["to_stage"]),
-                    timestamp=e["timestamp"],
-                    note=e.get("note"),
-                )
-                for e in raw.get("history", [])
-            ]
+            raw["stage"] = _STAGE_BY_VALUE[raw["stage"]]
+            # Entries older than the cap would be evicted from the deque anyway
+            history = raw.get("history", [])[-HISTORY_LIMIT:]
+            raw["history"] = deque(map(_entry_from_dict, history), maxlen=HISTORY_LIMIT)
             raw["review_notes"] = raw.get("review_notes")
             raw["retry_count"] = raw.get("retry_count", 0)
-            self._tasks[tid] = Task(**raw)
+            task = Task(**raw)
+            if task.stage is Stage.IN_PROGRESS:
+                task.in_progress_since = _entered_in_progress(task)
+            self._tasks[tid] = task
+            self._by_stage[task.stage][tid] = task
+        # Dependencies may appear later in the file than their dependents
+        for task in self._tasks.values():
+            self._index_dependencies(task)
+
+
+def _log_flush_error(task: asyncio.Task) -> None:
+    # A failed flush keeps its changes dirty; the next write retries them.
+    if not task.cancelled() and task.exception():
+        logger.error("Debounced persist failed: {}", task.exception())
+
+
+def _entry_from_dict(raw: dict) -> AuditEntry:
+    from_stage = raw["from_stage"]
+    note = raw.get("note")
+    return AuditEntry(
+        from_stage=_STAGE_BY_VALUE[from_stage] if from_stage else None,
+        to_stage=_STAGE_BY_VALUE[raw["to_stage"]],
+        timestamp=raw["timestamp"],
+        # Share one string per distinct note ("created", repeated rejection
+        # reasons) instead of one per loaded entry
+        note=sys.intern(note) if note else None,
+    )
+
+
+def _entered_in_progress(task: Task) -> float | None:
+    """Epoch seconds of the task's most recent move into IN_PROGRESS."""
+    for entry in reversed(task.history):
+        if entry.to_stage is Stage.IN_PROGRESS:
+            return datetime.fromisoformat(entry.timestamp).timestamp()
+    return None
+
+
+async def check_stale_tasks(
+    board: AsyncKanbanBoard, threshold_seconds: int = 300
+) -> list[Task]:
+    """
+    Run one poll of the stale monitor: fire on_stale_task for each stale task.
+
+    Args:
+        board: The AsyncKanbanBoard instance to check.
+        threshold_seconds: Maximum seconds allowed in IN_PROGRESS (default: 300).
+
+    Returns:
+        The tasks found stale.
+    """
+    stale = board.find_stale(threshold_seconds)
+    if stale:
+        logger.warning("Found {} stale tasks", len(stale))
+        for task in stale:
+            await board._fire_hook("on_stale_task", task)
+    return stale
 
 
 async def stale_task_monitor(
     board: "AsyncKanbanBoard",
     threshold_seconds: int = 300,
     poll_interval_seconds: int = 60,
+    *,
+    tick: asyncio.Event | None = None,
 ) -> None:
     """
     Background task that polls for stale tasks and fires on_stale_task hooks.
@@ -348,6 +565,8 @@ async def stale_task_monitor(
         board: The AsyncKanbanBoard instance to monitor.
         threshold_seconds: Maximum seconds allowed in IN_PROGRESS (default: 300).
         poll_interval_seconds: How often to poll for stale tasks (default: 60).
+        tick: If given, poll each time this event is set instead of every
+            ``poll_interval_seconds``, so callers (tests) choose when a pass runs.
 
     Raises:
         asyncio.CancelledError: When the monitor is cancelled during shutdown.
@@ -360,13 +579,12 @@ async def stale_task_monitor(
 
     try:
         while True:
-            await asyncio.sleep(poll_interval_seconds)
-            stale = board.find_stale(threshold_seconds)
-
-            if stale:
-                logger.warning("Found {} stale tasks", len(stale))
-                for task in stale:
-                    await board._fire_hook("on_stale_task", task)
+            if tick is None:
+                await asyncio.sleep(poll_interval_seconds)
+            else:
+                await tick.wait()
+                tick.clear()
+            await check_stale_tasks(board, threshold_seconds)
     except asyncio.CancelledError:
         logger.info("Stale task monitor shutting down...")
         raise
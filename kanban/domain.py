@@ -7,7 +7,8 @@ innermost layer and has zero side-effects.
 
 from __future__ import annotations
 
-import uuid
+import os
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
@@ -18,26 +19,45 @@ from enum import Enum
 
 
 class Stage(str, Enum):
+    # Members are singletons; the board compares stages with ``is``, so a
+    # Task's stage must always hold a member, never its raw string value.
     BACKLOG = "backlog"
     IN_PROGRESS = "in_progress"
     REVIEW = "review"
     DONE = "done"
 
 
+def _new_id() -> str:
+    """8 random hex chars — the old ``uuid4()[:8]`` shape, minus the UUID."""
+    return os.urandom(4).hex()
+
+
+# Audit entries kept per task. A task bounced between Review and Backlog
+# indefinitely would otherwise grow (and re-serialise) its history forever.
+HISTORY_LIMIT = 256
+
+
+def _new_history() -> deque[AuditEntry]:
+    return deque(maxlen=HISTORY_LIMIT)
+
+
+def utc_now() -> str:
+    """Current UTC time as an ISO-8601 string — the format of every timestamp."""
+    return datetime.now(timezone.utc).isoformat()
+
+
 # ---------------------------------------------------------------------------
 # AuditEntry
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AuditEntry:
     """A single immutable record of a stage transition."""
 
     from_stage: Stage | None  # None for the initial "created" entry
     to_stage: Stage
-    timestamp: str = field(
-        default_factory=lambda: datetime.now(timezone.utc).isoformat()
-    )
+    timestamp: str = field(default_factory=utc_now)
     note: str | None = None  # optional free-text reason
 
     def __str__(self) -> str:
@@ -45,13 +65,22 @@ class AuditEntry:
         note_str = f" ({self.note})" if self.note else ""
         return f"[{self.timestamp}] {arrow}{self.to_stage.value}{note_str}"
 
+    def to_dict(self) -> dict:
+        """JSON-ready dict, built by hand (``asdict`` deep-copies every field)."""
+        return {
+            "from_stage": self.from_stage.value if self.from_stage else None,
+            "to_stage": self.to_stage.value,
+            "timestamp": self.timestamp,
+            "note": self.note,
+        }
+
 
 # ---------------------------------------------------------------------------
 # Task
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class Task:
     """
     Represents a task in the kanban board.
@@ -59,28 +88,33 @@ class Task:
     Attributes:
         title: Human-readable title of the task.
         description: Detailed description of what needs to be done.
-        id: Unique identifier (8-character UUID prefix).
+        id: Unique identifier (8 random hex characters).
         stage: Current stage (BACKLOG, IN_PROGRESS, REVIEW, DONE).
         created_at: ISO timestamp when task was created.
         code_snippet: Generated code snippet (set by coding assistant).
         depends_on: List of task IDs that must be DONE before this task can start.
-        history: Audit log of all stage transitions.
+        history: Audit log of stage transitions, oldest first. Only the
+            most recent ``HISTORY_LIMIT`` entries are kept.
         review_notes: Reviewer feedback (set by reviewer assistant).
         retry_count: Number of times task has been rejected from REVIEW.
+        version: In-memory mutation counter, bumped by the board on every
+            change. Not persisted.
+        in_progress_since: Epoch seconds of the last move into IN_PROGRESS
+            while the task is there, else None. Rebuilt from history on load.
     """
 
     title: str
     description: str
-    id: str = field(default_factory=lambda: str(uuid.uuid4())[:8])
+    id: str = field(default_factory=_new_id)
     stage: Stage = Stage.BACKLOG
-    created_at: str = field(
-        default_factory=lambda: datetime.now(timezone.utc).isoformat()
-    )
+    created_at: str = field(default_factory=utc_now)
     code_snippet: str | None = None
     depends_on: list[str] = field(default_factory=list)  # list of Task.id
-    history: list[AuditEntry] = field(default_factory=list)  # audit log
+    history: deque[AuditEntry] = field(default_factory=_new_history)  # audit log
     review_notes: str | None = None
     retry_count: int = 0
+    version: int = field(default=0, compare=False)
+    in_progress_since: float | None = field(default=None, compare=False)
 
     def __str__(self) -> str:
         deps = f" deps={self.depends_on}" if self.depends_on else ""
@@ -90,6 +124,21 @@ class Task:
         )
         return f"[{self.id}] {self.title!r} — {self.stage.value}{deps}{retry}{preview}"
 
+    def to_dict(self) -> dict:
+        """JSON-ready dict for persistence, built by hand like ``AuditEntry``."""
+        return {
+            "title": self.title,
+            "description": self.description,
+            "id": self.id,
+            "stage": self.stage.value,
+            "created_at": self.created_at,
+            "code_snippet": self.code_snippet,
+            "depends_on": list(self.depends_on),
+            "history": [e.to_dict() for e in self.history],
+            "review_notes": self.review_notes,
+            "retry_count": self.retry_count,
+        }
+
 
 # ---------------------------------------------------------------------------
 # Exceptions
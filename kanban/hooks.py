@@ -13,6 +13,7 @@ Available hook events:
 
 from __future__ import annotations
 
+import asyncio
 from typing import Awaitable, Callable
 
 from loguru import logger
@@ -38,12 +39,26 @@ class HookRegistry:
             raise ValueError(f"Unknown hook event: {event}")
         self._hooks[event].append(hook)
 
+    def has(self, event: str) -> bool:
+        """True if anything listens for ``event`` — lets hot paths skip ``fire``."""
+        return bool(self._hooks.get(event))
+
     async def fire(self, event: str, task: Task) -> None:
-        for hook in self._hooks.get(event, []):
-            try:
-                await hook(task)
-            except Exception as e:
-                logger.error(f"Hook {event} failed: {e}")
+        """Run every hook for ``event`` concurrently; failures are logged."""
+        hooks = self._hooks.get(event, [])
+        if len(hooks) == 1:
+            await self._safe(event, hooks[0], task)
+        elif hooks:
+            # Hooks are independent, so fan-out costs the slowest one
+            # rather than the sum of all of them.
+            await asyncio.gather(*(self._safe(event, hook, task) for hook in hooks))
+
+    @staticmethod
+    async def _safe(event: str, hook: AsyncHookFn, task: Task) -> None:
+        try:
+            await hook(task)
+        except Exception as e:
+            logger.error("Hook {} failed: {}", event, e)
 
 
 async def log_transition(task: Task) -> None:
@@ -0,0 +1,141 @@
+"""
+Board persistence — snapshot file plus an append-only journal.
+
+Rewriting the whole board on every mutation makes each O(1) change cost
+O(N) bytes of I/O. Instead, the store keeps:
+
+  - a snapshot (``board.json``): every task, keyed by id
+  - a journal  (``board.wal``):  one JSON line per changed task since the
+    snapshot was taken
+
+Loading replays the journal over the snapshot (last record per id wins)
+and truncates a torn tail left by a crash, so new appends follow the last
+whole record.
+Once the journal holds ``compact_every`` records it is folded back into a
+fresh snapshot, written atomically via a temp file + ``os.replace``.
+
+Appends are fsynced only when the caller asks for durability (the board
+does so for approvals and rejections), and then once per append however
+many records it carries. The board hands over everything that changed
+while the previous write was in flight as one append (group commit), so
+a burst of mutations costs a couple of fsyncs rather than one per
+mutation. Snapshots are always fsynced, along with their directory so
+the rename itself survives a crash.
+
+All methods are synchronous; the board calls them from a worker thread.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+try:  # optional C encoder; stdlib json is the fallback
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps(data: dict) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data).encode()
+
+
+def loads(raw: bytes) -> dict:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+class JournalStore:
+    """
+    Args:
+        path:          Snapshot file. The journal lives next to it with a
+                       ``.wal`` suffix.
+        compact_every: Journal records to accumulate before compacting.
+        fsync:         Set ``False`` to never fsync (tmpfs, throwaway boards).
+    """
+
+    def __init__(
+        self, path: Path, compact_every: int = 500, fsync: bool = True
+    ) -> None:
+        self.path = path
+        self.journal_path = path.with_suffix(".wal")
+        self.compact_every = compact_every
+        self.fsync = fsync
+        self._journal_records = 0
+
+    def exists(self) -> bool:
+        return self.path.exists() or self.journal_path.exists()
+
+    @property
+    def should_compact(self) -> bool:
+        return self._journal_records >= self.compact_every
+
+    def load(self) -> dict[str, dict]:
+        """Return ``{task_id: task_dict}`` with the journal applied."""
+        data: dict[str, dict] = {}
+        if self.path.exists():
+            data = loads(self.path.read_bytes())
+
+        self._journal_records = 0
+        if self.journal_path.exists():
+            raw = self.journal_path.read_bytes()
+            good_end = 0  # byte offset just past the last whole record
+            while (newline := raw.find(b"\n", good_end)) != -1:
+                line = raw[good_end:newline]
+                if line:
+                    try:
+                        record = loads(line)
+                    except ValueError:
+                        # Torn write from a crash — everything before it is
+                        # intact, so stop here.
+                        break
+                    data[record["id"]] = record
+                    self._journal_records += 1
+                good_end = newline + 1
+            if good_end < len(raw):
+                # Cut the torn tail off, or later appends would land behind
+                # it and be skipped on the next load.
+                with open(self.journal_path, "r+b") as f:
+                    f.truncate(good_end)
+                    self._sync(f)
+        return data
+
+    def append(self, records: list[dict], durable: bool = False) -> None:
+        """Append one journal line per changed task; fsync if ``durable``."""
+        payload = b"".join(dumps(r) + b"\n" for r in records)
+        with open(self.journal_path, "ab") as f:
+            f.write(payload)
+            if durable:
+                self._sync(f)
+        self._journal_records += len(records)
+
+    def compact(self, data: dict[str, dict]) -> None:
+        """Replace the snapshot with ``data`` and empty the journal."""
+        tmp = self.path.with_suffix(self.path.suffix + ".tmp")
+        with open(tmp, "wb") as f:
+            f.write(dumps(data))
+            self._sync(f)
+        os.replace(tmp, self.path)
+        self._sync_dir()
+        # A crash before this point just replays the journal onto the new
+        # snapshot; records are whole-task upserts, so that is harmless.
+        self.journal_path.unlink(missing_ok=True)
+        self._journal_records = 0
+
+    def _sync(self, f) -> None:
+        if self.fsync:
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _sync_dir(self) -> None:
+        # Directory fds can only be opened (and fsynced) on POSIX
+        if self.fsync and os.name == "posix":
+            fd = os.open(self.path.parent, os.O_RDONLY)
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
@@ -13,8 +13,12 @@ with a single argument — no changes to board logic required.
 from __future__ import annotations
 
 import json
-import uuid
-from dataclasses import asdict, dataclass, field
+import os
+import pickle
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
 from pathlib import Path
@@ -22,34 +26,113 @@ from typing import Callable
 
 from loguru import logger
 
+try:  # optional C JSON encoder; stdlib json is the fallback
+    import orjson
+except ImportError:
+    orjson = None
+
 # ---------------------------------------------------------------------------
 # Domain
 # ---------------------------------------------------------------------------
 
 
 class Stage(str, Enum):
+    # Members are singletons; the board compares stages with ``is``, so a
+    # Task's stage must always hold a member, never its raw string value.
     BACKLOG = "backlog"
     IN_PROGRESS = "in_progress"
     REVIEW = "review"
     DONE = "done"
 
 
-@dataclass
+# Plain dict lookup for loading, skipping Enum's call machinery per task.
+_STAGE_BY_VALUE = {stage.value: stage for stage in Stage}
+
+
+def _new_id() -> str:
+    """8 random hex chars — the old ``uuid4()[:8]`` shape, minus the UUID."""
+    return os.urandom(4).hex()
+
+
+# (millisecond, ISO string) of the last call — one tuple, so threads never
+# see a mismatched pair.
+_last_now: tuple[int, str] = (-1, "")
+
+
+def _now_iso() -> str:
+    """Current UTC time in ISO-8601, formatted at most once per millisecond."""
+    global _last_now
+    ms = time.time_ns() // 1_000_000
+    last_ms, iso = _last_now
+    if ms != last_ms:
+        iso = datetime.fromtimestamp(ms / 1000, tz=timezone.utc).isoformat()
+        _last_now = (ms, iso)
+    return iso
+
+
+@dataclass(slots=True)
 class Task:
     title: str
     description: str
-    id: str = field(default_factory=lambda: str(uuid.uuid4())[:8])
+    id: str = field(default_factory=_new_id)
     stage: Stage = Stage.BACKLOG
-    created_at: str = field(
-        default_factory=lambda: datetime.now(timezone.utc).isoformat()
-    )
+    created_at: str = field(default_factory=_now_iso)
     code_snippet: str | None = None
 
     def __str__(self) -> str:
-        snippet_preview = (
-            f"\n  snippet: {self.code_snippet[:60]}..." if self.code_snippet else ""
+        if not self.code_snippet:
+            return f"[{self.id}] {self.title!r} — {self.stage.value}"
+        return (
+            f"[{self.id}] {self.title!r} — {self.stage.value}"
+            f"\n  snippet: {self.code_snippet[:60]}..."
         )
-        return f"[{self.id}] {self.title!r} — {self.stage.value}{snippet_preview}"
+
+    def to_dict(self) -> dict:
+        """JSON-ready dict, built by hand (``asdict`` deep-copies every field)."""
+        return {
+            "title": self.title,
+            "description": self.description,
+            "id": self.id,
+            "stage": self.stage.value,
+            "created_at": self.created_at,
+            "code_snippet": self.code_snippet,
+        }
+
+
+def _dumps(data: dict, indent: bool = False) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else None)
+    return json.dumps(data, indent=2 if indent else None).encode()
+
+
+def _loads(raw: bytes) -> dict:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _shared(snippet: str | None) -> str | None:
+    """Interned snippet, so tasks with identical snippets share one string."""
+    return sys.intern(snippet) if snippet else snippet
+
+
+def _write_file(path: Path, data: bytes, mode: int, fsync: bool = False) -> None:
+    """
+    Write already-encoded bytes straight to a file descriptor.
+
+    ``mode`` is ``os.O_APPEND`` or ``os.O_TRUNC``. Skips the buffered file
+    object ``open()`` would wrap around the descriptor — the payload is
+    written whole anyway.
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | mode, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view) :]
+        if fsync:
+            os.fsync(fd)
+    finally:
+        os.close(fd)
 
 
 # ---------------------------------------------------------------------------
@@ -86,12 +169,25 @@ class KanbanBoard:
     """
     In-memory Kanban board.  Optionally persists state to a JSON file.
 
+    Persistence is a snapshot (``persist_path``) plus an append-only JSONL
+    journal next to it: each mutation queues one small event (``create``,
+    ``move``, ``snippet``) instead of rewriting every task. Queued events
+    are appended in one write ``SAVE_DELAY`` seconds after the first of
+    them; once the journal holds ``COMPACT_EVERY`` events it is folded into
+    a fresh snapshot. Call ``flush()`` to write immediately, or
+    ``compact()`` (run on leaving a ``with`` block) to flush and compact.
+
     Args:
         assistant:   Any callable (str) -> str.  Defaults to mock_assistant.
         persist_path: If given, board state is saved after every mutation.
+                      A ``.pkl`` suffix stores the snapshot as a pickle —
+                      faster to write and load than JSON, but only load
+                      pickles this board wrote itself.
     """
 
     DEFAULT_PERSIST_PATH = Path("board.json")
+    SAVE_DELAY = 0.05  # seconds
+    COMPACT_EVERY = 200  # journal events
 
     def __init__(
         self,
@@ -99,10 +195,24 @@ class KanbanBoard:
         persist_path: Path | None = DEFAULT_PERSIST_PATH,
     ) -> None:
         self._tasks: dict[str, Task] = {}
+        # Per-stage index kept in lock-step with ``Task.stage``, so stage
+        # counts and listings never scan every task.
+        self._by_stage: dict[Stage, dict[str, Task]] = {s: {} for s in Stage}
         self._assistant = assistant
         self._persist_path = persist_path
-
-        if persist_path and persist_path.exists():
+        self._journal_path = (
+            persist_path.with_suffix(".jsonl") if persist_path else None
+        )
+        self._pickled = persist_path is not None and persist_path.suffix == ".pkl"
+        self._journal_events = 0
+        self._pending: list[dict] = []
+        # to_dict() of each task as of its last change, reused by compaction
+        # so only tasks changed since the previous snapshot are re-walked.
+        self._dict_cache: dict[str, dict] = {}
+        self._flush_timer: threading.Timer | None = None
+        self._save_lock = threading.Lock()
+
+        if persist_path and (persist_path.exists() or self._journal_path.exists()):
             self._load(persist_path)
             logger.info("Board loaded from {}", persist_path)
 
@@ -112,77 +222,204 @@ class KanbanBoard:
 
     def create_task(self, title: str, description: str) -> Task:
         task = Task(title=title, description=description)
-        self._tasks[task.id] = task
+        self._add(task)
         logger.info("Created task {} → {}", task.id, Stage.BACKLOG.value)
-        self._save()
+        self._save({"op": "create", "task": task.to_dict()})
         return task
 
     def move_to_in_progress(self, task_id: str) -> Task:
         task = self._get(task_id)
         self._assert_stage(task, Stage.BACKLOG)
-        task.stage = Stage.IN_PROGRESS
+        self._set_stage(task, Stage.IN_PROGRESS)
         logger.info("Task {} → {}", task_id, Stage.IN_PROGRESS.value)
 
         logger.info("Coding assistant is analysing task {}…", task_id)
-        task.code_snippet = self._assistant(task.description)
+        task.code_snippet = _shared(self._assistant(task.description))
         logger.success("Coding assistant finished for task {}", task_id)
 
-        self._save()
+        self._save({"op": "move", "id": task_id, "stage": task.stage.value})
+        self._save({"op": "snippet", "id": task_id, "code_snippet": task.code_snippet})
         return task
 
     def move_to_review(self, task_id: str) -> Task:
         task = self._get(task_id)
         self._assert_stage(task, Stage.IN_PROGRESS)
-        task.stage = Stage.REVIEW
+        self._set_stage(task, Stage.REVIEW)
         logger.info("Task {} → {}", task_id, Stage.REVIEW.value)
-        self._save()
+        self._save({"op": "move", "id": task_id, "stage": task.stage.value})
         return task
 
     def approve(self, task_id: str) -> Task:
         task = self._get(task_id)
         self._assert_stage(task, Stage.REVIEW)
-        task.stage = Stage.DONE
+        self._set_stage(task, Stage.DONE)
         logger.success("Task {} approved → {}", task_id, Stage.DONE.value)
-        self._save()
+        self._save({"op": "move", "id": task_id, "stage": task.stage.value})
         return task
 
+    def get_task(self, task_id: str) -> Task:
+        """Public read access; raises ``KeyError`` for unknown ids."""
+        return self._get(task_id)
+
+    def flush(self) -> None:
+        """Write pending changes to disk now, if there are any."""
+        with self._save_lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            if not self._pending:
+                return
+            events = self._pending
+            if (
+                not self._persist_path.exists()
+                or self._journal_events + len(events) >= self.COMPACT_EVERY
+            ):
+                # Memory already reflects every queued event, so a snapshot
+                # covers them
+                self._compact()
+            else:
+                payload = b"".join(_dumps(e) + b"\n" for e in events)
+                _write_file(self._journal_path, payload, os.O_APPEND)
+                self._journal_events += len(events)
+            # Only dropped once written; a failed write leaves them queued
+            self._pending = []
+        logger.debug("Board persisted to {}", self._persist_path)
+
+    def _flush_later(self) -> None:
+        """Timer callback: flush, logging a failure instead of losing it."""
+        try:
+            self.flush()
+        except Exception as e:
+            # The events stay queued; the next save or flush retries them
+            logger.error("Deferred save to {} failed: {}", self._persist_path, e)
+
+    def compact(self) -> None:
+        """Flush, then fold the journal into a fresh snapshot."""
+        self.flush()
+        with self._save_lock:
+            if self._journal_events:
+                self._compact()
+
+    def __enter__(self) -> KanbanBoard:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.compact()
+
     def board_view(self) -> None:
         """Prints a simple board snapshot grouped by stage."""
-        for stage in Stage:
-            tasks = [t for t in self._tasks.values() if t.stage == stage]
-            print(f"\n── {stage.value.upper()} ({len(tasks)}) ──")
-            for t in tasks:
-                print(" ", t)
+        lines = []
+        for stage, tasks in self._by_stage.items():
+            lines.append(f"\n── {stage.value.upper()} ({len(tasks)}) ──")
+            lines.extend(f"  {t}" for t in tasks.values())
+        print("\n".join(lines))
 
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
 
     def _get(self, task_id: str) -> Task:
-        if task_id not in self._tasks:
+        task = self._tasks.get(task_id)
+        if task is None:
             raise KeyError(f"Task '{task_id}' not found.")
-        return self._tasks[task_id]
+        return task
+
+    def _add(self, task: Task) -> None:
+        self._tasks[task.id] = task
+        self._by_stage[task.stage][task.id] = task
+
+    def _set_stage(self, task: Task, stage: Stage) -> None:
+        """Move a task to ``stage``, keeping the per-stage index in sync."""
+        del self._by_stage[task.stage][task.id]
+        task.stage = stage
+        self._by_stage[stage][task.id] = task
+
+    def _count_stage(self, stage: Stage) -> int:
+        return len(self._by_stage[stage])
 
     @staticmethod
     def _assert_stage(task: Task, expected: Stage) -> None:
-        if task.stage != expected:
+        if task.stage is not expected:
             raise ValueError(
                 f"Task '{task.id}' is in stage '{task.stage.value}', "
                 f"expected '{expected.value}'."
             )
 
-    def _save(self) -> None:
+    def _save(self, event: dict) -> None:
+        """Queue a journal event; the write happens in ``flush``."""
         if not self._persist_path:
             return
-        data = {tid: asdict(t) for tid, t in self._tasks.items()}
-        self._persist_path.write_text(json.dumps(data, indent=2))
-        logger.debug("Board persisted to {}", self._persist_path)
+        with self._save_lock:
+            self._pending.append(event)
+            self._dict_cache.pop(event.get("id"), None)
+            if self._flush_timer is None:
+                # Non-daemon, so a pending write still lands at interpreter exit
+                self._flush_timer = threading.Timer(self.SAVE_DELAY, self._flush_later)
+                self._flush_timer.start()
+
+    def _compact(self) -> None:
+        """Rewrite the snapshot from memory and drop the journal (lock held)."""
+        if self._pickled:
+            tasks = list(self._tasks.values())
+            payload = pickle.dumps(tasks, protocol=pickle.HIGHEST_PROTOCOL)
+        else:
+            cache = self._dict_cache
+            data = {
+                tid: cache.get(tid) or cache.setdefault(tid, t.to_dict())
+                for tid, t in list(self._tasks.items())
+            }
+            payload = _dumps(data, indent=True)
+        # Write a temp file and rename it over the snapshot, so a crash (or
+        # another process loading) never sees a half-written file.
+        tmp = self._persist_path.with_suffix(self._persist_path.suffix + ".tmp")
+        try:
+            _write_file(tmp, payload, os.O_TRUNC, fsync=True)
+            os.replace(tmp, self._persist_path)
+        except BaseException:
+            tmp.unlink(missing_ok=True)
+            raise
+        self._journal_path.unlink(missing_ok=True)
+        self._journal_events = 0
 
     def _load(self, path: Path) -> None:
-        data = json.loads(path.read_text())
-        for tid, raw in data.items():
-            raw["stage"] = Stage(raw["stage"])
-            self._tasks[tid] = Task(**raw)
+        for task in self._read_snapshot(path) if path.exists() else ():
+            self._add(task)
+        if self._journal_path.exists():
+            raw = self._journal_path.read_bytes()
+            good_end = 0  # byte offset just past the last whole event
+            while (newline := raw.find(b"\n", good_end)) != -1:
+                try:
+                    event = _loads(raw[good_end:newline])
+                except ValueError:
+                    break  # torn write; everything before it is intact
+                self._apply(event)
+                self._journal_events += 1
+                good_end = newline + 1
+            if good_end < len(raw):
+                # Drop the torn tail, or later appends would land behind it
+                # and be skipped on the next load
+                os.truncate(self._journal_path, good_end)
+
+    def _read_snapshot(self, path: Path) -> list[Task]:
+        if self._pickled:
+            return pickle.loads(path.read_bytes())
+        tasks = []
+        for raw in _loads(path.read_bytes()).values():
+            raw["stage"] = _STAGE_BY_VALUE[raw["stage"]]
+            raw["code_snippet"] = _shared(raw["code_snippet"])
+            tasks.append(Task(**raw))
+        return tasks
+
+    def _apply(self, event: dict) -> None:
+        """Replay one journal event onto the in-memory tasks."""
+        if event["op"] == "create":
+            raw = event["task"]
+            raw["stage"] = _STAGE_BY_VALUE[raw["stage"]]
+            self._add(Task(**raw))
+        elif event["op"] == "move":
+            self._set_stage(self._tasks[event["id"]], _STAGE_BY_VALUE[event["stage"]])
+        elif event["op"] == "snippet":
+            self._tasks[event["id"]].code_snippet = _shared(event["code_snippet"])
 
 
 # ---------------------------------------------------------------------------
@@ -211,7 +448,7 @@ if __name__ == "__main__":
 
     # 3. Inspect the generated snippet
     print("\n── Generated snippet for", t1.title, "──")
-    print(board._tasks[t1.id].code_snippet)
+    print(board.get_task(t1.id).code_snippet)
 
     # 4. Send to review, then approve
     board.move_to_review(t1.id)
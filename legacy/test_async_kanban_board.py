@@ -1,6 +1,7 @@
 import asyncio
-import tempfile
-from pathlib import Path
+import time
+from dataclasses import replace
+from datetime import datetime, timezone
 
 import pytest
 import pytest_asyncio
@@ -14,26 +15,14 @@ from async_kanban_board import (
 
 from kanban.board import AsyncKanbanBoard as KanbanBoard
 from kanban.board import stale_task_monitor
-from kanban.domain import AuditEntry
 from kanban.domain import Stage as KanbanStage
-
-
-@pytest.fixture
-def temp_persist_path():
-    """Create a temporary file path for board persistence."""
-    with tempfile.NamedTemporaryFile(delete=False, suffix=".json") as f:
-        path = Path(f.name)
-    yield path
-    if path.exists():
-        path.unlink()
+from kanban.domain import Task as KanbanTask
 
 
 @pytest_asyncio.fixture
-async def board(temp_persist_path):
-    """Create a fresh board for each test."""
-    if temp_persist_path.exists():
-        temp_persist_path.unlink()
-    return AsyncKanbanBoard(persist_path=temp_persist_path)
+async def board():
+    """Create a fresh in-memory board for each test."""
+    return AsyncKanbanBoard(persist_path=None)
 
 
 @pytest_asyncio.fixture
@@ -43,19 +32,34 @@ async def board_no_persist():
 
 
 @pytest_asyncio.fixture
-async def board_wip_2(temp_persist_path):
+async def board_wip_2():
     """Create a board with WIP limit of 2."""
-    if temp_persist_path.exists():
-        temp_persist_path.unlink()
-    return AsyncKanbanBoard(wip_limit=2, persist_path=temp_persist_path)
+    return AsyncKanbanBoard(wip_limit=2, persist_path=None)
 
 
 @pytest_asyncio.fixture
-async def new_board(temp_persist_path):
-    """Create a fresh kanban.board.AsyncKanbanBoard for each test."""
-    if temp_persist_path.exists():
-        temp_persist_path.unlink()
-    return KanbanBoard(persist_path=temp_persist_path)
+async def new_board():
+    """Create a fresh in-memory kanban.board.AsyncKanbanBoard for each test."""
+    return KanbanBoard(persist_path=None)
+
+
+@pytest.fixture
+def backdate_in_progress():
+    """Return a helper that makes a task look ``seconds_ago`` into In-Progress."""
+
+    def _backdate(task: KanbanTask, seconds_ago: float) -> None:
+        old_time = time.time() - seconds_ago
+        timestamp = datetime.fromtimestamp(old_time, tz=timezone.utc).isoformat()
+        # Rewrite the latest In-Progress entry in place; it is almost always
+        # the last one, so this stops after a step or two.
+        history = task.history
+        for i in range(len(history) - 1, -1, -1):
+            if history[i].to_stage is KanbanStage.IN_PROGRESS:
+                history[i] = replace(history[i], timestamp=timestamp)
+                task.in_progress_since = old_time
+                break
+
+    return _backdate
 
 
 @pytest.mark.asyncio
@@ -110,12 +114,15 @@ async def test_move_to_in_progress_invalid_stage(board):
 @pytest.mark.asyncio
 async def test_wip_limit(board_wip_2):
     """Test WIP limit is enforced."""
-    t1 = await board_wip_2.create_task("Task 1", "Desc 1")
-    t2 = await board_wip_2.create_task("Task 2", "Desc 2")
-    t3 = await board_wip_2.create_task("Task 3", "Desc 3")
+    t1, t2, t3 = await asyncio.gather(
+        board_wip_2.create_task("Task 1", "Desc 1"),
+        board_wip_2.create_task("Task 2", "Desc 2"),
+        board_wip_2.create_task("Task 3", "Desc 3"),
+    )
 
-    await board_wip_2.move_to_in_progress(t1.id)
-    await board_wip_2.move_to_in_progress(t2.id)
+    await asyncio.gather(
+        board_wip_2.move_to_in_progress(t1.id), board_wip_2.move_to_in_progress(t2.id)
+    )
 
     with pytest.raises(WIPLimitError, match="WIP limit reached"):
         await board_wip_2.move_to_in_progress(t3.id)
@@ -124,12 +131,15 @@ async def test_wip_limit(board_wip_2):
 @pytest.mark.asyncio
 async def test_wip_limit_after_completion(board_wip_2):
     """Test WIP limit allows new tasks after completion."""
-    t1 = await board_wip_2.create_task("Task 1", "Desc 1")
-    t2 = await board_wip_2.create_task("Task 2", "Desc 2")
-    t3 = await board_wip_2.create_task("Task 3", "Desc 3")
+    t1, t2, t3 = await asyncio.gather(
+        board_wip_2.create_task("Task 1", "Desc 1"),
+        board_wip_2.create_task("Task 2", "Desc 2"),
+        board_wip_2.create_task("Task 3", "Desc 3"),
+    )
 
-    await board_wip_2.move_to_in_progress(t1.id)
-    await board_wip_2.move_to_in_progress(t2.id)
+    await asyncio.gather(
+        board_wip_2.move_to_in_progress(t1.id), board_wip_2.move_to_in_progress(t2.id)
+    )
 
     await board_wip_2.move_to_review(t1.id)
     await board_wip_2.approve(t1.id)
@@ -141,9 +151,11 @@ async def test_wip_limit_after_completion(board_wip_2):
 @pytest.mark.asyncio
 async def test_concurrent_start_respects_wip_limit(board_wip_2):
     """Test concurrent start operations respect WIP limit."""
-    t1 = await board_wip_2.create_task("Task 1", "Desc 1")
-    t2 = await board_wip_2.create_task("Task 2", "Desc 2")
-    t3 = await board_wip_2.create_task("Task 3", "Desc 3")
+    t1, t2, t3 = await asyncio.gather(
+        board_wip_2.create_task("Task 1", "Desc 1"),
+        board_wip_2.create_task("Task 2", "Desc 2"),
+        board_wip_2.create_task("Task 3", "Desc 3"),
+    )
 
     results = await asyncio.gather(
         board_wip_2.move_to_in_progress(t1.id),
@@ -225,8 +237,6 @@ async def test_get_nonexistent_task(board):
 @pytest.mark.asyncio
 async def test_persistence(temp_persist_path):
     """Test that board state persists to file."""
-    if temp_persist_path.exists():
-        temp_persist_path.unlink()
     board1 = AsyncKanbanBoard(persist_path=temp_persist_path)
     t1 = await board1.create_task("Persist Test", "Will be saved")
     t1_id = t1.id
@@ -241,16 +251,13 @@ async def test_persistence(temp_persist_path):
 
 
 @pytest.mark.asyncio
-async def test_no_persistence():
+async def test_no_persistence(tmp_path, monkeypatch):
     """Test board with persist_path=None doesn't create files."""
-    import tempfile
+    monkeypatch.chdir(tmp_path)  # where the default board.json would land
+    board = AsyncKanbanBoard(persist_path=None)
+    await board.create_task("No Persist", "Should not save")
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        persist_path = Path(tmpdir) / "board.json"
-        board = AsyncKanbanBoard(persist_path=None)
-        await board.create_task("No Persist", "Should not save")
-
-        assert not persist_path.exists()
+    assert list(tmp_path.iterdir()) == []
 
 
 @pytest.mark.asyncio
@@ -285,8 +292,12 @@ async def test_lock_protects_concurrent_mutations(board):
     async def try_move():
         return await board.move_to_in_progress(task.id)
 
-    with pytest.raises(InvalidTransitionError):
-        await asyncio.gather(try_move(), try_move())
+    # Collect both outcomes so the winning move is never left running
+    # after the test returns.
+    results = await asyncio.gather(try_move(), try_move(), return_exceptions=True)
+    errors = [r for r in results if isinstance(r, BaseException)]
+    assert len(errors) == 1
+    assert isinstance(errors[0], InvalidTransitionError)
 
 
 @pytest.mark.asyncio
@@ -306,44 +317,47 @@ async def test_count_stage(board):
 @pytest.mark.asyncio
 async def test_assistant_runs_outside_lock():
     """Test that assistant runs outside the lock to allow concurrency."""
-    call_count = 0
-
-    async def slow_assistant(desc):
-        nonlocal call_count
-        call_count += 1
-        await asyncio.sleep(0.05)
-        return f"code {call_count}"
-
-    import tempfile
-
-    with tempfile.TemporaryDirectory() as tmpdir:
-        persist_path = Path(tmpdir) / "board.json"
-        board = AsyncKanbanBoard(
-            assistant=slow_assistant, wip_limit=2, persist_path=persist_path
-        )
-
-        t1 = await board.create_task("T1", "D1")
-        t2 = await board.create_task("T2", "D2")
+    entered = 0
+    both_entered = asyncio.Event()
+    release = asyncio.Event()
+
+    async def gated_assistant(desc):
+        nonlocal entered
+        entered += 1
+        if entered == 2:
+            both_entered.set()
+        await release.wait()
+        return f"code {entered}"
+
+    board = AsyncKanbanBoard(assistant=gated_assistant, wip_limit=2, persist_path=None)
+
+    t1, t2 = await asyncio.gather(
+        board.create_task("T1", "D1"), board.create_task("T2", "D2")
+    )
 
-        start = asyncio.get_event_loop().time()
-        await asyncio.gather(
-            board.move_to_in_progress(t1.id),
-            board.move_to_in_progress(t2.id),
-        )
-        elapsed = asyncio.get_event_loop().time() - start
+    moves = asyncio.gather(
+        board.move_to_in_progress(t1.id),
+        board.move_to_in_progress(t2.id),
+    )
+    try:
+        # Both calls must be inside the assistant before either returns; if
+        # the assistant ran under the lock the second would never get in.
+        await asyncio.wait_for(both_entered.wait(), timeout=1)
+    finally:
+        release.set()
+    await moves
 
-        # If assistant ran inside lock sequentially, would take ~0.1s
-        # With concurrent execution, should take ~0.05s
-        assert elapsed < 0.08
-        assert call_count == 2
+    assert entered == 2
 
 
 @pytest.mark.asyncio
 async def test_multiple_tasks_workflow(board):
     """Test managing multiple tasks through full workflow."""
-    t1 = await board.create_task("Task 1", "First task")
-    t2 = await board.create_task("Task 2", "Second task")
-    t3 = await board.create_task("Task 3", "Third task")
+    t1, t2, t3 = await asyncio.gather(
+        board.create_task("Task 1", "First task"),
+        board.create_task("Task 2", "Second task"),
+        board.create_task("Task 3", "Third task"),
+    )
 
     await board.move_to_in_progress(t1.id)
     await board.move_to_review(t1.id)
@@ -367,29 +381,13 @@ async def test_find_stale_no_stale_tasks(new_board):
 
 
 @pytest.mark.asyncio
-async def test_find_stale_with_stale_task(new_board):
+async def test_find_stale_with_stale_task(new_board, backdate_in_progress):
     """Test find_stale correctly identifies stale IN_PROGRESS tasks."""
-    from datetime import datetime, timezone
-
     task = await new_board.create_task("Stale Task", "Will become stale")
     await new_board.move_to_in_progress(task.id)
 
     # Manually set the transition time to be old
-    for entry in reversed(task.history):
-        if entry.to_stage == KanbanStage.IN_PROGRESS:
-            old_time = datetime.now(timezone.utc).timestamp() - 400
-            task.history.remove(entry)
-            task.history.append(
-                AuditEntry(
-                    from_stage=entry.from_stage,
-                    to_stage=entry.to_stage,
-                    timestamp=datetime.fromtimestamp(
-                        old_time, tz=timezone.utc
-                    ).isoformat(),
-                    note=entry.note,
-                )
-            )
-            break
+    backdate_in_progress(task, 400)
 
     stale = new_board.find_stale(threshold_seconds=300)
     assert len(stale) == 1
@@ -397,7 +395,7 @@ async def test_find_stale_with_stale_task(new_board):
 
 
 @pytest.mark.asyncio
-async def test_find_stale_ignores_non_in_progress(new_board):
+async def test_find_stale_ignores_non_in_progress(new_board, backdate_in_progress):
     """Test find_stale ignores tasks not in IN_PROGRESS stage."""
     t1 = await new_board.create_task("Task 1", "Desc 1")
     t2 = await new_board.create_task("Task 2", "Desc 2")
@@ -411,23 +409,7 @@ async def test_find_stale_ignores_non_in_progress(new_board):
     await new_board.move_to_in_progress(t2.id)
 
     # Set t2 as stale
-    from datetime import datetime, timezone
-
-    for entry in reversed(t2.history):
-        if entry.to_stage == KanbanStage.IN_PROGRESS:
-            old_time = datetime.now(timezone.utc).timestamp() - 400
-            t2.history.remove(entry)
-            t2.history.append(
-                AuditEntry(
-                    from_stage=entry.from_stage,
-                    to_stage=entry.to_stage,
-                    timestamp=datetime.fromtimestamp(
-                        old_time, tz=timezone.utc
-                    ).isoformat(),
-                    note=entry.note,
-                )
-            )
-            break
+    backdate_in_progress(t2, 400)
 
     stale = new_board.find_stale(threshold_seconds=300)
     assert len(stale) == 1
@@ -435,7 +417,9 @@ async def test_find_stale_ignores_non_in_progress(new_board):
 
 
 @pytest.mark.asyncio
-async def test_find_stale_uses_audit_timestamp_not_created_at(new_board):
+async def test_find_stale_uses_audit_timestamp_not_created_at(
+    new_board, backdate_in_progress
+):
     """Test find_stale uses audit trail timestamp, not task.created_at."""
     from datetime import datetime, timedelta, timezone
 
@@ -453,21 +437,7 @@ async def test_find_stale_uses_audit_timestamp_not_created_at(new_board):
     assert len(stale) == 0
 
     # Now make the IN_PROGRESS transition old
-    for entry in reversed(task.history):
-        if entry.to_stage == KanbanStage.IN_PROGRESS:
-            old_time = datetime.now(timezone.utc).timestamp() - 400
-            task.history.remove(entry)
-            task.history.append(
-                AuditEntry(
-                    from_stage=entry.from_stage,
-                    to_stage=entry.to_stage,
-                    timestamp=datetime.fromtimestamp(
-                        old_time, tz=timezone.utc
-                    ).isoformat(),
-                    note=entry.note,
-                )
-            )
-            break
+    backdate_in_progress(task, 400)
 
     # Now task should be stale
     stale = new_board.find_stale(threshold_seconds=300)
@@ -476,10 +446,9 @@ async def test_find_stale_uses_audit_timestamp_not_created_at(new_board):
 
 
 @pytest.mark.asyncio
-async def test_stale_monitor(new_board):
+async def test_stale_monitor(new_board, backdate_in_progress):
     """Test stale task monitor detects and fires hooks for stale tasks."""
     import asyncio
-    from datetime import datetime, timezone
 
     threshold = 1  # 1 second
     poll_interval = 1  # 1 second
@@ -495,27 +464,15 @@ async def test_stale_monitor(new_board):
     new_board._hook_registry.register("on_stale_task", track_stale)
 
     # Manually set the transition time to be old
-    for entry in reversed(task.history):
-        if entry.to_stage == KanbanStage.IN_PROGRESS:
-            old_time = datetime.now(timezone.utc).timestamp() - 2
-            task.history.remove(entry)
-            task.history.append(
-                AuditEntry(
-                    from_stage=entry.from_stage,
-                    to_stage=entry.to_stage,
-                    timestamp=datetime.fromtimestamp(
-                        old_time, tz=timezone.utc
-                    ).isoformat(),
-                    note=entry.note,
-                )
-            )
-            break
-
-    # Start monitor, wait for detection, then cancel
+    backdate_in_progress(task, 2)
+
+    # Start monitor, run one poll, then cancel
+    tick = asyncio.Event()
     monitor = asyncio.create_task(
-        stale_task_monitor(new_board, threshold, poll_interval)
+        stale_task_monitor(new_board, threshold, poll_interval, tick=tick)
     )
-    await asyncio.sleep(2)  # Wait for at least one poll cycle
+    tick.set()
+    await asyncio.sleep(0)  # Let the monitor run its poll
     monitor.cancel()
 
     try:
@@ -528,10 +485,9 @@ async def test_stale_monitor(new_board):
 
 
 @pytest.mark.asyncio
-async def test_stale_monitor_respects_stage_changes(new_board):
+async def test_stale_monitor_respects_stage_changes(new_board, backdate_in_progress):
     """Test that tasks moved out of IN_PROGRESS are no longer considered stale."""
     import asyncio
-    from datetime import datetime, timezone
 
     threshold = 1  # 1 second
     poll_interval = 1  # 1 second
@@ -547,32 +503,22 @@ async def test_stale_monitor_respects_stage_changes(new_board):
     new_board._hook_registry.register("on_stale_task", track_stale)
 
     # Set the transition time to be old
-    for entry in reversed(task.history):
-        if entry.to_stage == KanbanStage.IN_PROGRESS:
-            old_time = datetime.now(timezone.utc).timestamp() - 2
-            task.history.remove(entry)
-            task.history.append(
-                AuditEntry(
-                    from_stage=entry.from_stage,
-                    to_stage=entry.to_stage,
-                    timestamp=datetime.fromtimestamp(
-                        old_time, tz=timezone.utc
-                    ).isoformat(),
-                    note=entry.note,
-                )
-            )
-            break
+    backdate_in_progress(task, 2)
 
     # Start monitor
+    tick = asyncio.Event()
     monitor = asyncio.create_task(
-        stale_task_monitor(new_board, threshold, poll_interval)
+        stale_task_monitor(new_board, threshold, poll_interval, tick=tick)
     )
-    await asyncio.sleep(1.5)  # Wait for at least one poll cycle
+    tick.set()
+    await asyncio.sleep(0)  # Let the monitor run its poll
+    assert hook_calls == [task.id]
 
     # Move task to REVIEW - should stop being stale
     await new_board.move_to_review(task.id)
 
-    await asyncio.sleep(1.5)  # Wait for another poll cycle
+    tick.set()
+    await asyncio.sleep(0)  # Let the monitor run another poll
     monitor.cancel()
 
     try:
@@ -580,25 +526,29 @@ async def test_stale_monitor_respects_stage_changes(new_board):
     except asyncio.CancelledError:
         pass
 
-    # Hook should have fired at least once before we moved the task
-    assert len(hook_calls) >= 1
+    # Hook fired only for the poll before we moved the task
+    assert hook_calls == [task.id]
 
 
 @pytest.mark.asyncio
-async def test_stale_monitor_handles_multiple_stale_tasks(new_board):
+async def test_stale_monitor_handles_multiple_stale_tasks(
+    new_board, backdate_in_progress
+):
     """Test monitor fires hook for each stale task."""
     import asyncio
-    from datetime import datetime, timezone
 
     threshold = 2  # 2 seconds
     poll_interval = 1  # 1 second
 
-    t1 = await new_board.create_task("Task 1", "Stale 1")
-    t2 = await new_board.create_task("Task 2", "Stale 2")
-    t3 = await new_board.create_task("Task 3", "Fresh")
+    t1, t2, t3 = await asyncio.gather(
+        new_board.create_task("Task 1", "Stale 1"),
+        new_board.create_task("Task 2", "Stale 2"),
+        new_board.create_task("Task 3", "Fresh"),
+    )
 
-    await new_board.move_to_in_progress(t1.id)
-    await new_board.move_to_in_progress(t2.id)
+    await asyncio.gather(
+        new_board.move_to_in_progress(t1.id), new_board.move_to_in_progress(t2.id)
+    )
 
     hook_calls = []
 
@@ -609,30 +559,18 @@ async def test_stale_monitor_handles_multiple_stale_tasks(new_board):
 
     # Make t1 and t2 old (3 seconds ago, exceeding the 2-second threshold)
     for task in [t1, t2]:
-        for entry in reversed(task.history):
-            if entry.to_stage == KanbanStage.IN_PROGRESS:
-                old_time = datetime.now(timezone.utc).timestamp() - 3
-                task.history.remove(entry)
-                task.history.append(
-                    AuditEntry(
-                        from_stage=entry.from_stage,
-                        to_stage=entry.to_stage,
-                        timestamp=datetime.fromtimestamp(
-                            old_time, tz=timezone.utc
-                        ).isoformat(),
-                        note=entry.note,
-                    )
-                )
-                break
+        backdate_in_progress(task, 3)
 
     # Move t3 to IN_PROGRESS last so it's naturally fresh (will be < 2 seconds old when checked)
     await new_board.move_to_in_progress(t3.id)
 
     # Start monitor
+    tick = asyncio.Event()
     monitor = asyncio.create_task(
-        stale_task_monitor(new_board, threshold, poll_interval)
+        stale_task_monitor(new_board, threshold, poll_interval, tick=tick)
     )
-    await asyncio.sleep(1.5)  # Wait for at least one poll cycle
+    tick.set()
+    await asyncio.sleep(0)  # Let the monitor run its poll
     monitor.cancel()
 
     try:
@@ -1,29 +1,21 @@
-import asyncio
-import tempfile
-from pathlib import Path
-from unittest.mock import AsyncMock, MagicMock
+import json
+import os
+import pickle
+from dataclasses import asdict
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
 
 import pytest
-from kanban_board import KanbanBoard, Stage, mock_assistant
-
-
-@pytest.fixture
-def temp_persist_path():
-    """Create a temporary file path for board persistence."""
-    with tempfile.NamedTemporaryFile(delete=False, suffix=".json") as f:
-        path = Path(f.name)
-    yield path
-    if path.exists():
-        path.unlink()
+from kanban_board import KanbanBoard, Stage, Task, mock_assistant
 
 
 @pytest.fixture
 def board(temp_persist_path):
     """Create a fresh board for each test."""
-    # Delete empty file first
-    if temp_persist_path.exists():
-        temp_persist_path.unlink()
-    return KanbanBoard(assistant=mock_assistant, persist_path=temp_persist_path)
+    board = KanbanBoard(assistant=mock_assistant, persist_path=temp_persist_path)
+    yield board
+    # Write now rather than from a timer thread after the test has finished
+    board.flush()
 
 
 @pytest.fixture
@@ -61,15 +53,23 @@ def test_create_task_with_custom_assistant(custom_assistant, temp_persist_path):
     assert task.code_snippet == "custom code snippet"
 
 
-def test_move_to_in_progress(board):
-    """Test moving a task from Backlog to In-Progress."""
+@pytest.mark.parametrize(
+    "moves,expected",
+    [
+        (["move_to_in_progress"], Stage.IN_PROGRESS),
+        (["move_to_in_progress", "move_to_review"], Stage.REVIEW),
+        (["move_to_in_progress", "move_to_review", "approve"], Stage.DONE),
+    ],
+    ids=["in_progress", "review", "approve"],
+)
+def test_transition(board, moves, expected):
+    """Test each move lands the task in the next stage."""
     task = board.create_task("Test", "Desc")
 
-    updated = board.move_to_in_progress(task.id)
+    for move in moves:
+        updated = getattr(board, move)(task.id)
 
-    assert updated.stage == Stage.IN_PROGRESS
-    assert updated.code_snippet is not None
-    assert "AUTO-GENERATED PLACEHOLDER" in updated.code_snippet
+    assert updated.stage == expected
 
 
 def test_move_to_in_progress_invalid_stage(board):
@@ -81,16 +81,6 @@ def test_move_to_in_progress_invalid_stage(board):
         board.move_to_in_progress(task.id)
 
 
-def test_move_to_review(board):
-    """Test moving a task from In-Progress to Review."""
-    task = board.create_task("Test", "Desc")
-    board.move_to_in_progress(task.id)
-
-    updated = board.move_to_review(task.id)
-
-    assert updated.stage == Stage.REVIEW
-
-
 def test_move_to_review_invalid_stage(board):
     """Test that moving from wrong stage raises ValueError."""
     task = board.create_task("Test", "Desc")
@@ -99,17 +89,6 @@ def test_move_to_review_invalid_stage(board):
         board.move_to_review(task.id)
 
 
-def test_approve_task(board):
-    """Test approving a task from Review to Done."""
-    task = board.create_task("Test", "Desc")
-    board.move_to_in_progress(task.id)
-    board.move_to_review(task.id)
-
-    updated = board.approve(task.id)
-
-    assert updated.stage == Stage.DONE
-
-
 def test_approve_invalid_stage(board):
     """Test that approving from wrong stage raises ValueError."""
     task = board.create_task("Test", "Desc")
@@ -126,7 +105,7 @@ def test_full_workflow(board):
 
     task = board.move_to_in_progress(task.id)
     assert task.stage == Stage.IN_PROGRESS
-    assert task.code_snippet is not None
+    assert "AUTO-GENERATED PLACEHOLDER" in task.code_snippet
 
     task = board.move_to_review(task.id)
     assert task.stage == Stage.REVIEW
@@ -141,6 +120,17 @@ def test_get_nonexistent_task(board):
         board._get("nonexistent")
 
 
+def test_get_task(board):
+    """Test the public accessor returns the live task object."""
+    task = board.create_task("Test", "Desc")
+    board.move_to_in_progress(task.id)
+
+    assert board.get_task(task.id) is task
+    assert board.get_task(task.id).stage == Stage.IN_PROGRESS
+    with pytest.raises(KeyError, match="not found"):
+        board.get_task("nonexistent")
+
+
 def test_multiple_tasks(board):
     """Test managing multiple tasks."""
     t1 = board.create_task("Task 1", "First task")
@@ -160,13 +150,11 @@ def test_multiple_tasks(board):
 
 def test_persistence(temp_persist_path):
     """Test that board state persists to file."""
-    # Delete the empty file first so board1 starts fresh
-    if temp_persist_path.exists():
-        temp_persist_path.unlink()
     board1 = KanbanBoard(persist_path=temp_persist_path, assistant=mock_assistant)
     t1 = board1.create_task("Persist Test", "Will be saved")
     t1_id = t1.id
     board1.move_to_in_progress(t1_id)
+    board1.flush()
 
     board2 = KanbanBoard(persist_path=temp_persist_path, assistant=mock_assistant)
     loaded_task = board2._get(t1_id)
@@ -176,16 +164,14 @@ def test_persistence(temp_persist_path):
     assert loaded_task.code_snippet is not None
 
 
-def test_no_persistence():
+def test_no_persistence(tmp_path, monkeypatch):
     """Test board with persist_path=None doesn't create files."""
-    import tempfile
+    monkeypatch.chdir(tmp_path)
+    board = KanbanBoard(persist_path=None)
+    board.create_task("No Persist", "Should not save")
+    board.flush()
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        persist_path = Path(tmpdir) / "board.json"
-        board = KanbanBoard(persist_path=None)
-        board.create_task("No Persist", "Should not save")
-
-        assert not persist_path.exists()
+    assert list(tmp_path.iterdir()) == []
 
 
 def test_board_view(board, capsys):
@@ -201,25 +187,35 @@ def test_board_view(board, capsys):
     assert "Task 2" in captured.out
 
 
-def test_task_string_representation(board):
-    """Test Task __str__ method."""
-    task = board.create_task("Test Task", "Test description")
+def test_board_view_groups_by_stage(board, capsys):
+    """Test every stage gets a heading and its own tasks, in stage order."""
+    t1 = board.create_task("Task 1", "Desc 1")
+    board.create_task("Task 2", "Desc 2")
+    board.move_to_in_progress(t1.id)
 
-    str_repr = str(task)
+    board.board_view()
+    out = capsys.readouterr().out
 
-    assert task.id in str_repr
-    assert "Test Task" in str_repr
-    assert "backlog" in str_repr
+    assert out.index("── BACKLOG (1) ──") < out.index("Task 2")
+    assert out.index("── IN_PROGRESS (1) ──") < out.index("Task 1")
+    assert "── REVIEW (0) ──" in out
+    assert "── DONE (0) ──" in out
 
 
-def test_task_string_representation_with_snippet(board):
-    """Test Task __str__ with code snippet."""
-    task = board.create_task("Test", "Desc")
-    board.move_to_in_progress(task.id)
+@pytest.mark.parametrize(
+    "started,needles",
+    [(False, ("Test Task", "backlog")), (True, ("Test Task", "snippet:"))],
+    ids=["plain", "with_snippet"],
+)
+def test_task_string_representation(board, started, needles):
+    """Test Task __str__ with and without a code snippet."""
+    task = board.create_task("Test Task", "Test description")
+    if started:
+        board.move_to_in_progress(task.id)
 
     str_repr = str(task)
 
-    assert "snippet:" in str_repr
+    assert all(needle in str_repr for needle in (task.id, *needles))
 
 
 def test_mock_assistant():
@@ -233,27 +229,218 @@ def test_mock_assistant():
 
 def test_create_task_saves_persistence(temp_persist_path):
     """Test that creating a task triggers save."""
-    # Delete empty file first
-    if temp_persist_path.exists():
-        temp_persist_path.unlink()
     board = KanbanBoard(persist_path=temp_persist_path, assistant=mock_assistant)
     board.create_task("Save Test", "Test save on create")
+    board.flush()
 
     assert temp_persist_path.exists()
 
 
 def test_move_task_saves_persistence(temp_persist_path):
     """Test that moving a task triggers save."""
-    # Delete empty file first
-    if temp_persist_path.exists():
-        temp_persist_path.unlink()
     board = KanbanBoard(persist_path=temp_persist_path, assistant=mock_assistant)
     task = board.create_task("Move Test", "Test save on move")
-    initial_mtime = temp_persist_path.stat().st_mtime
+    board.flush()
+
+    board.move_to_in_progress(task.id)
+    board.flush()
+
+    # The move is journalled; the snapshot is only rewritten on compaction
+    journal = temp_persist_path.with_suffix(".jsonl")
+    ops = [json.loads(line)["op"] for line in journal.read_bytes().splitlines()]
+    assert ops == ["move", "snippet"]
+
+
+def test_saves_are_coalesced(temp_persist_path, monkeypatch):
+    """Test a burst of mutations is queued and written in a single save."""
+    writes = []
+    original_replace = os.replace
+
+    def counting_replace(src, dst):
+        if dst == temp_persist_path:  # ignore other tests' pending saves
+            writes.append(dst)
+        return original_replace(src, dst)
+
+    monkeypatch.setattr(os, "replace", counting_replace)
+    board = KanbanBoard(persist_path=temp_persist_path, assistant=mock_assistant)
+    task = board.create_task("Burst", "Many changes")
+    board.move_to_in_progress(task.id)
+    board.move_to_review(task.id)
+    assert writes == []
+    assert board._flush_timer is not None
+
+    board.flush()
+    assert writes == [temp_persist_path]
+    assert board._flush_timer is None
+    assert KanbanBoard(persist_path=temp_persist_path)._get(task.id).stage == (
+        Stage.REVIEW
+    )
+
 
-    import time
+def test_events_after_torn_journal_tail_survive_reload(temp_persist_path):
+    """Test events flushed after recovering from a torn tail are not lost."""
+    journal = temp_persist_path.with_suffix(".jsonl")
+    board = KanbanBoard(persist_path=temp_persist_path)
+    board.create_task("Task 1", "In the snapshot")
+    board.flush()
+    board.create_task("Task 2", "In the journal")
+    board.flush()
+    with open(journal, "ab") as f:
+        f.write(b'{"op": "create", "task"')
 
-    time.sleep(0.01)
+    recovered = KanbanBoard(persist_path=temp_persist_path)
+    recovered.create_task("Task 3", "After the crash")
+    recovered.flush()
+
+    assert len(KanbanBoard(persist_path=temp_persist_path)._tasks) == 3
+
+
+def test_context_manager_flushes(temp_persist_path):
+    """Test leaving the with-block writes pending changes immediately."""
+    with KanbanBoard(persist_path=temp_persist_path) as board:
+        board.create_task("Ctx", "Flushed on exit")
+
+    assert temp_persist_path.exists()
+
+
+def test_journal_replay_and_compaction(temp_persist_path):
+    """Test journalled events survive a reload and fold into the snapshot."""
+    journal = temp_persist_path.with_suffix(".jsonl")
+    board = KanbanBoard(persist_path=temp_persist_path, assistant=mock_assistant)
+    first = board.create_task("First", "Goes into the snapshot")
+    board.flush()
+    second = board.create_task("Second", "Journalled")
+    board.move_to_in_progress(first.id)
+    board.flush()
+    assert len(journal.read_text().splitlines()) == 3
+
+    reloaded = KanbanBoard(persist_path=temp_persist_path)
+    assert reloaded._get(first.id).stage == Stage.IN_PROGRESS
+    assert reloaded._get(first.id).code_snippet == first.code_snippet
+    assert reloaded._get(second.id).title == "Second"
+
+    reloaded.compact()
+    assert not journal.exists()
+    again = KanbanBoard(persist_path=temp_persist_path)
+    assert again._get(first.id).stage == Stage.IN_PROGRESS
+    assert again._get(second.id).stage == Stage.BACKLOG
+
+
+def test_compaction_reuses_unchanged_task_dicts(temp_persist_path, monkeypatch):
+    """Test a snapshot only re-serialises tasks changed since the last one."""
+    board = KanbanBoard(persist_path=temp_persist_path)
+    tasks = [board.create_task(f"Task {i}", "Desc") for i in range(3)]
+    board.compact()
+
+    walked = []
+    original_to_dict = Task.to_dict
+
+    def counting_to_dict(task):
+        walked.append(task.id)
+        return original_to_dict(task)
+
+    monkeypatch.setattr(Task, "to_dict", counting_to_dict)
+    board.move_to_in_progress(tasks[1].id)
+    board.compact()
+
+    assert walked == [tasks[1].id]
+    reloaded = KanbanBoard(persist_path=temp_persist_path)
+    assert reloaded._get(tasks[1].id).stage == Stage.IN_PROGRESS
+
+
+def test_task_to_dict_matches_dataclass_fields():
+    """Test the hand-rolled serializer covers every Task field."""
+    task = Task(title="T", description="D", code_snippet="x = 1")
+
+    assert task.to_dict() == {**asdict(task), "stage": "backlog"}
+    assert not hasattr(task, "__dict__")
+
+
+def test_count_stage_tracks_transitions(temp_persist_path):
+    """Test the per-stage index follows moves and is rebuilt on load."""
+    board = KanbanBoard(persist_path=temp_persist_path)
+    t1 = board.create_task("Task 1", "Desc 1")
+    board.create_task("Task 2", "Desc 2")
+    board.flush()
+    board.move_to_in_progress(t1.id)
+    board.move_to_review(t1.id)
+    board.flush()
+
+    for b in (board, KanbanBoard(persist_path=temp_persist_path)):
+        assert b._count_stage(Stage.BACKLOG) == 1
+        assert b._count_stage(Stage.IN_PROGRESS) == 0
+        assert b._count_stage(Stage.REVIEW) == 1
+
+
+def test_created_at_is_utc_iso(board):
+    """Test created_at stays an ISO-8601 UTC timestamp at millisecond precision."""
+    first = board.create_task("Task 1", "Desc 1")
+    second = board.create_task("Task 2", "Desc 2")
+
+    created = datetime.fromisoformat(first.created_at)
+    assert created.tzinfo == timezone.utc
+    assert created.microsecond % 1000 == 0
+    assert abs((datetime.now(timezone.utc) - created).total_seconds()) < 5
+    assert second.created_at >= first.created_at
+
+
+def test_snapshot_write_is_atomic(temp_persist_path, monkeypatch):
+    """Test a failed snapshot write leaves the previous snapshot intact."""
+    board = KanbanBoard(persist_path=temp_persist_path)
+    task = board.create_task("Kept", "Survives a failed write")
+    board.flush()
+    before = temp_persist_path.read_bytes()
+
+    def failing_fsync(fd):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(os, "fsync", failing_fsync)
     board.move_to_in_progress(task.id)
+    with pytest.raises(OSError):
+        board.compact()
+
+    assert temp_persist_path.read_bytes() == before
+
+
+def test_failed_flush_keeps_pending_events(temp_persist_path, monkeypatch):
+    """Test a failed write keeps its events queued and drops the temp file."""
+    board = KanbanBoard(persist_path=temp_persist_path)
+    task = board.create_task("Kept", "Queued until written")
+
+    def failing_replace(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr("os.replace", failing_replace)
+    with pytest.raises(OSError):
+        board.flush()
+    assert not temp_persist_path.with_suffix(".json.tmp").exists()
+
+    monkeypatch.undo()
+    board.flush()
+    assert KanbanBoard(persist_path=temp_persist_path)._get(task.id).title == "Kept"
+
+
+def test_pickle_snapshot_round_trip(tmp_path):
+    """Test a .pkl persist path stores and reloads the snapshot as a pickle."""
+    path = tmp_path / "board.pkl"
+    with KanbanBoard(persist_path=path) as board:
+        task = board.create_task("Pickled", "Binary snapshot")
+        board.move_to_in_progress(task.id)
+
+    assert pickle.loads(path.read_bytes())[0].id == task.id
+    loaded = KanbanBoard(persist_path=path)._get(task.id)
+    assert loaded.stage == Stage.IN_PROGRESS
+    assert loaded.code_snippet == task.code_snippet
+
+
+def test_identical_snippets_share_one_string(temp_persist_path):
+    """Test tasks with the same snippet hold one string, also after a reload."""
+    with KanbanBoard(persist_path=temp_persist_path) as board:
+        t1 = board.create_task("Task 1", "Same description")
+        t2 = board.create_task("Task 2", "Same description")
+        board.move_to_in_progress(t1.id)
+        board.move_to_in_progress(t2.id)
+    assert t1.code_snippet is t2.code_snippet
 
-    assert temp_persist_path.stat().st_mtime > initial_mtime
+    reloaded = KanbanBoard(persist_path=temp_persist_path)
+    assert reloaded._get(t1.id).code_snippet is reloaded._get(t2.id).code_snippet
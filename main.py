@@ -6,42 +6,54 @@ import uvicorn
 from kanban.api import app
 
 
+async def _run_lifecycle(client: httpx.AsyncClient, base_url: str, task_id: str):
+    response = await client.post(f"{base_url}/tasks/{task_id}/start")
+    print(f"Start Task 2: {response.status_code} - {response.json()}")
+
+    response = await client.post(f"{base_url}/tasks/{task_id}/review")
+    print(f"Review Task 2: {response.status_code} - {response.json()}")
+
+    response = await client.post(f"{base_url}/tasks/{task_id}/approve")
+    print(f"Approve Task 2: {response.status_code} - {response.json()}")
+
+
+async def _list_tasks(client: httpx.AsyncClient, base_url: str):
+    response = await client.get(f"{base_url}/tasks")
+    print(f"List all tasks: {response.status_code} - {response.json()}")
+
+
 async def send_mock_requests():
     base_url = "http://127.0.0.1:8000"
 
     async with httpx.AsyncClient(timeout=30.0) as client:
-        response = await client.post(
-            f"{base_url}/tasks",
-            json={
-                "title": "Task 1",
-                "description": "First mock task",
-                "depends_on": [],
-            },
+        # The two creates are independent, as is listing the board against
+        # task 2's start/review/approve chain, so overlap those round-trips.
+        t1_resp, t2_resp = await asyncio.gather(
+            client.post(
+                f"{base_url}/tasks",
+                json={
+                    "title": "Task 1",
+                    "description": "First mock task",
+                    "depends_on": [],
+                },
+            ),
+            client.post(
+                f"{base_url}/tasks",
+                json={
+                    "title": "Task 2",
+                    "description": "Second mock task",
+                    "depends_on": [],
+                },
+            ),
         )
-        print(f"Create Task 1: {response.status_code} - {response.json()}")
-
-        response = await client.post(
-            f"{base_url}/tasks",
-            json={
-                "title": "Task 2",
-                "description": "Second mock task",
-                "depends_on": [],
-            },
-        )
-        print(f"Create Task 2: {response.status_code} - {response.json()}")
-        task2_id = response.json()["id"]
-
-        response = await client.get(f"{base_url}/tasks")
-        print(f"List all tasks: {response.status_code} - {response.json()}")
-
-        response = await client.post(f"{base_url}/tasks/{task2_id}/start")
-        print(f"Start Task 2: {response.status_code} - {response.json()}")
+        print(f"Create Task 1: {t1_resp.status_code} - {t1_resp.json()}")
+        print(f"Create Task 2: {t2_resp.status_code} - {t2_resp.json()}")
+        task2_id = t2_resp.json()["id"]
 
-        response = await client.post(f"{base_url}/tasks/{task2_id}/review")
-        print(f"Review Task 2: {response.status_code} - {response.json()}")
-
-        response = await client.post(f"{base_url}/tasks/{task2_id}/approve")
-        print(f"Approve Task 2: {response.status_code} - {response.json()}")
+        await asyncio.gather(
+            _list_tasks(client, base_url),
+            _run_lifecycle(client, base_url, task2_id),
+        )
 
         response = await client.get(f"{base_url}/board")
         print(f"Board snapshot: {response.status_code} - {response.json()}")
@@ -71,7 +83,11 @@ async def main():
 
     server_task = asyncio.create_task(run_server())
 
-    await asyncio.sleep(2)
+    while not server.started:
+        if server_task.done():
+            await server_task
+            return
+        await asyncio.sleep(0.005)
 
     await send_mock_requests()
 
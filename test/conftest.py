@@ -0,0 +1,55 @@
+"""Fixtures shared by the kanban package tests."""
+
+import time
+from dataclasses import replace
+from datetime import datetime, timezone
+
+import pytest
+import pytest_asyncio
+
+from kanban.board import AsyncKanbanBoard
+from kanban.domain import Stage, Task
+
+
+@pytest.fixture(scope="session", autouse=True)
+def lifespan_persist_path(tmp_path_factory):
+    """Point the API lifespan's board at a per-session file, not ./board.json.
+
+    Each pytest-xdist worker gets its own session, so parallel runs never
+    share the file.
+    """
+    path = tmp_path_factory.mktemp("lifespan") / "board.json"
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("BOARD_PERSIST_PATH", str(path))
+        yield path
+
+
+@pytest_asyncio.fixture
+async def board():
+    """Create a fresh in-memory board for each test."""
+    return AsyncKanbanBoard(persist_path=None)
+
+
+@pytest_asyncio.fixture
+async def disk_board(temp_persist_path):
+    """Create a fresh board persisted to ``temp_persist_path``."""
+    return AsyncKanbanBoard(persist_path=temp_persist_path)
+
+
+@pytest.fixture
+def backdate_in_progress():
+    """Return a helper that makes a task look ``seconds_ago`` into In-Progress."""
+
+    def _backdate(task: Task, seconds_ago: float) -> None:
+        old_time = time.time() - seconds_ago
+        timestamp = datetime.fromtimestamp(old_time, tz=timezone.utc).isoformat()
+        # Rewrite the latest In-Progress entry in place; it is almost always
+        # the last one, so this stops after a step or two.
+        history = task.history
+        for i in range(len(history) - 1, -1, -1):
+            if history[i].to_stage is Stage.IN_PROGRESS:
+                history[i] = replace(history[i], timestamp=timestamp)
+                task.in_progress_since = old_time
+                break
+
+    return _backdate
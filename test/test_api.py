@@ -1,68 +1,114 @@
+import asyncio
+import gc
 import sys
-import tempfile
+import time
 from pathlib import Path
 
+import httpx
 import pytest
 from fastapi.testclient import TestClient
 from pydantic import ValidationError
 
 sys.path.append(str(Path(__file__).resolve().parent.parent))
-from kanban.api import BoardSnapshot, CreateTaskRequest, TaskResponse, app
+from kanban.api import (
+    BoardSnapshot,
+    CreateTaskRequest,
+    TaskResponse,
+    _cache_for,
+    _http,
+    _response_caches,
+    app,
+    get_board,
+)
 from kanban.assistants import async_mock_reviewer
 from kanban.board import AsyncKanbanBoard
-from kanban.domain import Stage, TaskNotFoundError, WIPLimitError
+from kanban.domain import (
+    AuditEntry,
+    InvalidTransitionError,
+    Stage,
+    Task,
+    TaskNotFoundError,
+    UnresolvedDependencyError,
+    WIPLimitError,
+)
+
+
+@pytest.fixture(autouse=True)
+def reset_dependency_overrides():
+    """Drop any get_board override a test installed, even if it failed."""
+    yield
+    app.dependency_overrides.clear()
 
 
-@pytest.fixture
-def temp_persist_path():
-    """Create a temporary file path for board persistence."""
-    with tempfile.NamedTemporaryFile(delete=False, suffix=".json") as f:
-        path = Path(f.name)
-    yield path
-    if path.exists():
-        path.unlink()
+@pytest.fixture(scope="module")
+def module_client():
+    """One TestClient (and app lifespan) shared by every test in the module."""
+    with TestClient(app) as test_client:
+        yield test_client
 
 
 @pytest.fixture
-def client(temp_persist_path):
-    """Create a test client with fresh board state."""
-    from kanban.api import _board
+def serve_board(module_client):
+    """Factory serving a given board through the shared client."""
 
-    # Delete empty file first
-    if temp_persist_path.exists():
-        temp_persist_path.unlink()
+    def _serve(board: AsyncKanbanBoard) -> TestClient:
+        app.dependency_overrides[get_board] = lambda: board
+        return module_client
 
-    from kanban.api import get_board
+    return _serve
 
-    app.dependency_overrides[get_board] = lambda: AsyncKanbanBoard(
-        persist_path=temp_persist_path
-    )
 
-    with TestClient(app) as test_client:
-        yield test_client
+@pytest.fixture
+def client(serve_board):
+    """Create a test client with a fresh in-memory board."""
+    return serve_board(AsyncKanbanBoard(persist_path=None))
 
-    app.dependency_overrides.clear()
+
+@pytest.fixture
+def client_persist(serve_board, temp_persist_path):
+    """Create a test client whose board persists to ``temp_persist_path``."""
+    return serve_board(AsyncKanbanBoard(persist_path=temp_persist_path))
+
+
+# Endpoints that walk a fresh backlog task to each stage.
+_PATH_TO_STAGE = {
+    "backlog": [],
+    "in_progress": ["start"],
+    "review": ["start", "review"],
+    "done": ["start", "review", "approve"],
+}
 
 
 @pytest.fixture
-def client_wip_1(temp_persist_path):
-    """Create a test client with WIP limit of 1."""
-    from kanban.api import _board
+def task_in_stage(client):
+    """Factory creating a task through the API and moving it to a stage."""
 
-    # Delete empty file first
-    if temp_persist_path.exists():
-        temp_persist_path.unlink()
+    def _make(stage: str) -> str:
+        response = client.post("/tasks", json={"title": "x", "description": "y"})
+        task_id = response.json()["id"]
+        for endpoint in _PATH_TO_STAGE[stage]:
+            client.post(f"/tasks/{task_id}/{endpoint}")
+        return task_id
 
-    from kanban.api import get_board
+    return _make
 
-    app.dependency_overrides[get_board] = lambda: AsyncKanbanBoard(
-        wip_limit=1, persist_path=temp_persist_path
-    )
 
-    with TestClient(app) as test_client:
-        yield test_client
+@pytest.fixture(scope="module")
+def readonly_board():
+    """One in-memory board shared by tests that only look things up."""
+    return AsyncKanbanBoard(persist_path=None)
 
-    app.dependency_overrides.clear()
+
+@pytest.fixture
+def readonly_client(serve_board, readonly_board):
+    """Client over the shared in-memory board; no persistence file."""
+    return serve_board(readonly_board)
+
+
+@pytest.fixture
+def client_wip_1(serve_board):
+    """Create a test client with WIP limit of 1."""
+    return serve_board(AsyncKanbanBoard(wip_limit=1, persist_path=None))
 
 
 def test_create_task(client):
@@ -103,29 +149,27 @@ def test_create_task_with_dependencies(client):
     assert data["depends_on"] == [dep_id]
 
 
-def test_create_task_invalid_dependency(temp_persist_path):
-    """Test POST /tasks with non-existent dependency returns 404."""
-    # Delete empty file first
-    if temp_persist_path.exists():
-        temp_persist_path.unlink()
+def test_persistence_smoke(client_persist, temp_persist_path):
+    """Test API mutations reach disk and reload into a new board."""
+    task = client_persist.post("/tasks", json={"title": "Saved", "description": "D"})
+    task_id = task.json()["id"]
+    client_persist.post(f"/tasks/{task_id}/start")
 
-    from kanban.api import get_board
+    reloaded = AsyncKanbanBoard(persist_path=temp_persist_path)
 
-    app.dependency_overrides[get_board] = lambda: AsyncKanbanBoard(
-        persist_path=temp_persist_path
-    )
+    assert reloaded.get_task(task_id).stage == Stage.IN_PROGRESS
 
-    with TestClient(app) as test_client:
-        response = test_client.post(
-            "/tasks",
-            json={
-                "title": "Task",
-                "description": "Has invalid dependency",
-                "depends_on": ["nonexistent123"],
-            },
-        )
 
-    app.dependency_overrides.clear()
+def test_create_task_invalid_dependency(client):
+    """Test POST /tasks with non-existent dependency returns 404."""
+    response = client.post(
+        "/tasks",
+        json={
+            "title": "Task",
+            "description": "Has invalid dependency",
+            "depends_on": ["nonexistent123"],
+        },
+    )
 
     # TaskNotFoundError returns 404
     assert response.status_code == 404
@@ -169,9 +213,9 @@ def test_list_tasks_filter_by_stage(client):
     assert len(response.json()) == 1
 
 
-def test_list_tasks_invalid_stage(client):
+def test_list_tasks_invalid_stage(readonly_client):
     """Test GET /tasks with invalid stage."""
-    response = client.get("/tasks?stage=invalid")
+    response = readonly_client.get("/tasks?stage=invalid")
     assert response.status_code == 422
 
 
@@ -190,38 +234,44 @@ def test_get_task(client):
     assert data["title"] == "Single Task"
 
 
-def test_get_task_not_found(client):
+def test_get_task_not_found(readonly_client):
     """Test GET /tasks/{id} with non-existent task."""
-    response = client.get("/tasks/nonexistent")
+    response = readonly_client.get("/tasks/nonexistent")
     assert response.status_code == 404
 
 
-def test_start_task(client):
-    """Test POST /tasks/{id}/start endpoint."""
-    task = client.post("/tasks", json={"title": "Start Me", "description": "Go"})
+@pytest.mark.parametrize(
+    "endpoints,expected",
+    [
+        (["start"], "in_progress"),
+        (["start", "review"], "review"),
+        (["start", "review", "approve"], "done"),
+    ],
+    ids=["start", "review", "approve"],
+)
+def test_transition_endpoint(client, endpoints, expected):
+    """Test POST /tasks/{id}/<endpoint> moves the task to the next stage."""
+    task = client.post("/tasks", json={"title": "Move Me", "description": "Go"})
     task_id = task.json()["id"]
 
-    response = client.post(f"/tasks/{task_id}/start")
+    for endpoint in endpoints:
+        response = client.post(f"/tasks/{task_id}/{endpoint}")
 
     assert response.status_code == 200
-    data = response.json()
-    assert data["stage"] == "in_progress"
-    assert data["code_snippet"] is not None
+    assert response.json()["stage"] == expected
 
 
-def test_start_task_invalid_stage(client):
+def test_start_task_invalid_stage(client, task_in_stage):
     """Test starting a task not in backlog."""
-    task = client.post("/tasks", json={"title": "Task", "description": "Desc"})
-    task_id = task.json()["id"]
-    client.post(f"/tasks/{task_id}/start")
+    task_id = task_in_stage("in_progress")
 
     response = client.post(f"/tasks/{task_id}/start")
     assert response.status_code == 422
 
 
-def test_start_task_not_found(client):
+def test_start_task_not_found(readonly_client):
     """Test starting a non-existent task."""
-    response = client.post("/tasks/nonexistent/start")
+    response = readonly_client.post("/tasks/nonexistent/start")
     assert response.status_code == 404
 
 
@@ -236,58 +286,31 @@ def test_start_task_wip_limit(client_wip_1):
     assert response.status_code == 429
 
 
-def test_review_task(client):
-    """Test POST /tasks/{id}/review endpoint."""
-    task = client.post("/tasks", json={"title": "Review Me", "description": "Check"})
-    task_id = task.json()["id"]
-    client.post(f"/tasks/{task_id}/start")
-
-    response = client.post(f"/tasks/{task_id}/review")
-
-    assert response.status_code == 200
-    assert response.json()["stage"] == "review"
-
-
-def test_review_task_invalid_stage(client):
+def test_review_task_invalid_stage(client, task_in_stage):
     """Test reviewing a task not in in_progress."""
-    task = client.post("/tasks", json={"title": "Task", "description": "Desc"})
-    task_id = task.json()["id"]
+    task_id = task_in_stage("backlog")
 
     response = client.post(f"/tasks/{task_id}/review")
     assert response.status_code == 422
 
 
-def test_review_task_not_found(client):
+def test_review_task_not_found(readonly_client):
     """Test reviewing a non-existent task."""
-    response = client.post("/tasks/nonexistent/review")
+    response = readonly_client.post("/tasks/nonexistent/review")
     assert response.status_code == 404
 
 
-def test_approve_task(client):
-    """Test POST /tasks/{id}/approve endpoint."""
-    task = client.post("/tasks", json={"title": "Approve Me", "description": "Done"})
-    task_id = task.json()["id"]
-    client.post(f"/tasks/{task_id}/start")
-    client.post(f"/tasks/{task_id}/review")
-
-    response = client.post(f"/tasks/{task_id}/approve")
-
-    assert response.status_code == 200
-    assert response.json()["stage"] == "done"
-
-
-def test_approve_task_invalid_stage(client):
+def test_approve_task_invalid_stage(client, task_in_stage):
     """Test approving a task not in review."""
-    task = client.post("/tasks", json={"title": "Task", "description": "Desc"})
-    task_id = task.json()["id"]
+    task_id = task_in_stage("backlog")
 
     response = client.post(f"/tasks/{task_id}/approve")
     assert response.status_code == 422
 
 
-def test_approve_task_not_found(client):
+def test_approve_task_not_found(readonly_client):
     """Test approving a non-existent task."""
-    response = client.post("/tasks/nonexistent/approve")
+    response = readonly_client.post("/tasks/nonexistent/approve")
     assert response.status_code == 404
 
 
@@ -376,8 +399,6 @@ def test_task_response_schema():
 
 def test_task_response_from_task():
     """Test TaskResponse.from_task class method."""
-    from kanban.domain import Task
-
     task = Task(
         title="Test",
         description="Desc",
@@ -394,6 +415,65 @@ def test_task_response_from_task():
     assert response.depends_on == ["dep1"]
 
 
+def test_task_response_from_task_round_trips_validation():
+    """Test from_task output (built without validation) is still a valid model."""
+    task = Task(title="Test", description="Desc", depends_on=["dep1"])
+    task.history.append(AuditEntry(from_stage=None, to_stage=Stage.BACKLOG))
+    task.history.append(
+        AuditEntry(from_stage=Stage.BACKLOG, to_stage=Stage.IN_PROGRESS, note="go")
+    )
+
+    response = TaskResponse.from_task(task)
+    validated = TaskResponse.model_validate(response.model_dump())
+
+    assert validated == response
+    assert validated.history[1].from_stage == Stage.BACKLOG
+    assert validated.history[1].note == "go"
+
+
+def test_task_response_cached_until_task_changes():
+    """Test from_task reuses its response until the task's version moves on."""
+    task = Task(title="Test", description="Desc")
+    cache = {}
+
+    first = TaskResponse.from_task(task, cache)
+    assert TaskResponse.from_task(task, cache) is first
+    assert TaskResponse.from_task(task) is not first  # no cache, no reuse
+
+    task.stage = Stage.IN_PROGRESS
+    task.version += 1
+    second = TaskResponse.from_task(task, cache)
+    assert second is not first
+    assert second.stage == Stage.IN_PROGRESS
+
+
+def test_response_cache_is_per_board():
+    """Test boards sharing a task id never share cached responses."""
+    board_a = AsyncKanbanBoard(persist_path=None)
+    board_b = AsyncKanbanBoard(persist_path=None)
+    assert _cache_for(board_a) is _cache_for(board_a)
+    assert _cache_for(board_a) is not _cache_for(board_b)
+
+    task = Task(title="A", description="Desc")
+    twin = Task(title="B", description="Desc", id=task.id)
+    TaskResponse.from_task(task, _cache_for(board_a))
+    assert TaskResponse.from_task(twin, _cache_for(board_b)).title == "B"
+
+    # Dropping a board drops its cache and the responses in it
+    cached_boards = len(_response_caches)
+    del board_a
+    gc.collect()
+    assert len(_response_caches) == cached_boards - 1
+
+
+def test_task_response_is_frozen():
+    """Test cached responses cannot be mutated by one request and leak to the next."""
+    response = TaskResponse.from_task(Task(title="Test", description="Desc"))
+
+    with pytest.raises(ValidationError):
+        response.title = "changed"
+
+
 def test_board_snapshot_schema():
     """Test BoardSnapshot schema."""
     snapshot = BoardSnapshot(backlog=[], in_progress=[], review=[], done=[])
@@ -401,32 +481,24 @@ def test_board_snapshot_schema():
     assert snapshot.in_progress == []
 
 
-def test_exception_to_http_translation():
+@pytest.mark.parametrize(
+    "exc,code",
+    [
+        (TaskNotFoundError("task123"), 404),
+        (WIPLimitError(current=3, limit=3), 429),
+        (UnresolvedDependencyError(task_id="t1", blocking=["dep1"]), 409),
+        (
+            InvalidTransitionError(
+                task_id="t1", current=Stage.DONE, expected=Stage.BACKLOG
+            ),
+            422,
+        ),
+    ],
+    ids=lambda v: type(v).__name__ if isinstance(v, Exception) else None,
+)
+def test_exception_to_http_translation(exc, code):
     """Test that domain exceptions map to correct HTTP status codes."""
-    from kanban.api import _http
-    from kanban.domain import InvalidTransitionError, UnresolvedDependencyError
-
-    # TaskNotFoundError -> 404
-    exc = TaskNotFoundError("task123")
-    http_exc = _http(exc)
-    assert http_exc.status_code == 404
-
-    # WIPLimitError -> 429
-    exc = WIPLimitError(current=3, limit=3)
-    http_exc = _http(exc)
-    assert http_exc.status_code == 429
-
-    # UnresolvedDependencyError -> 409
-    exc = UnresolvedDependencyError(task_id="t1", blocking=["dep1"])
-    http_exc = _http(exc)
-    assert http_exc.status_code == 409
-
-    # InvalidTransitionError -> 422
-    exc = InvalidTransitionError(
-        task_id="t1", current=Stage.DONE, expected=Stage.BACKLOG
-    )
-    http_exc = _http(exc)
-    assert http_exc.status_code == 422
+    assert _http(exc).status_code == code
 
 
 def test_create_multiple_tasks(client):
@@ -480,129 +552,90 @@ def test_task_with_blocked_dependencies(client):
     assert response.status_code == 200
 
 
-def test_reviewer_sets_review_notes():
+def test_reviewer_sets_review_notes(serve_board):
     """Test that reviewer populates review_notes after move_to_review."""
-    with tempfile.NamedTemporaryFile(delete=False, suffix=".json") as f:
-        temp_path = Path(f.name)
-
-    # Delete empty file
-    temp_path.unlink()
-
-    from kanban.api import get_board
-
-    app.dependency_overrides[get_board] = lambda: AsyncKanbanBoard(
-        persist_path=temp_path, reviewer=async_mock_reviewer
+    client = serve_board(
+        AsyncKanbanBoard(persist_path=None, reviewer=async_mock_reviewer)
     )
 
-    with TestClient(app) as test_client:
-        task = test_client.post(
-            "/tasks", json={"title": "Review Test", "description": "Test with TODO"}
-        )
-        task_id = task.json()["id"]
-
-        test_client.post(f"/tasks/{task_id}/start")
+    task = client.post(
+        "/tasks", json={"title": "Review Test", "description": "Test with TODO"}
+    )
+    task_id = task.json()["id"]
 
-        response = test_client.post(f"/tasks/{task_id}/review")
-        assert response.status_code == 200
-        assert response.json()["review_notes"] is not None
-        assert (
-            "Review Checklist" in response.json()["review_notes"]
-            or "✓ Code reviewed" in response.json()["review_notes"]
-        )
+    client.post(f"/tasks/{task_id}/start")
 
-        # Check GET /tasks/{id} returns review_notes
-        get_response = test_client.get(f"/tasks/{task_id}")
-        assert get_response.status_code == 200
-        assert get_response.json()["review_notes"] is not None
+    response = client.post(f"/tasks/{task_id}/review")
+    assert response.status_code == 200
+    assert response.json()["review_notes"] is not None
+    assert (
+        "Review Checklist" in response.json()["review_notes"]
+        or "✓ Code reviewed" in response.json()["review_notes"]
+    )
 
-    app.dependency_overrides.clear()
+    # Check GET /tasks/{id} returns review_notes
+    get_response = client.get(f"/tasks/{task_id}")
+    assert get_response.status_code == 200
+    assert get_response.json()["review_notes"] is not None
 
 
-def test_reviewer_concurrent_with_board_operations():
+@pytest.mark.asyncio
+async def test_reviewer_concurrent_with_board_operations():
     """Test that reviewer runs concurrently with other board operations."""
-    import asyncio
-    import time
 
     async def slow_reviewer(description, snippet):
-        await asyncio.sleep(0.1)
+        await asyncio.sleep(0.01)
         return f"Review for {description[:20]}"
 
-    with tempfile.NamedTemporaryFile(delete=False, suffix=".json") as f:
-        temp_path = Path(f.name)
-
-    temp_path.unlink()
+    async def timed(request):
+        response = await request
+        return response, time.perf_counter()
 
-    from kanban.api import get_board
+    board = AsyncKanbanBoard(persist_path=None, reviewer=slow_reviewer)
+    app.dependency_overrides[get_board] = lambda: board
 
-    app.dependency_overrides[get_board] = lambda: AsyncKanbanBoard(
-        persist_path=temp_path, reviewer=slow_reviewer
-    )
-
-    with TestClient(app) as test_client:
-        t1 = test_client.post(
-            "/tasks", json={"title": "T1", "description": "First task"}
-        )
-        t2 = test_client.post(
-            "/tasks", json={"title": "T2", "description": "Second task"}
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as ac:
+        t1, t2 = await asyncio.gather(
+            ac.post("/tasks", json={"title": "T1", "description": "First task"}),
+            ac.post("/tasks", json={"title": "T2", "description": "Second task"}),
         )
-
         t1_id = t1.json()["id"]
         t2_id = t2.json()["id"]
 
-        test_client.post(f"/tasks/{t1_id}/start")
-        test_client.post(f"/tasks/{t2_id}/start")
-
-        # Move t1 to review - reviewer will run concurrently
-        start = time.time()
-        test_client.post(f"/tasks/{t1_id}/review")
-
-        # While reviewer runs, board should remain usable
-        get_response = test_client.get(f"/tasks/{t2_id}")
-        assert get_response.status_code == 200
+        await asyncio.gather(
+            ac.post(f"/tasks/{t1_id}/start"), ac.post(f"/tasks/{t2_id}/start")
+        )
 
-        elapsed = time.time() - start
-        assert elapsed < 0.2  # Should complete quickly even with slow reviewer
+        # Review t1 and, while its reviewer runs, read t2 on the same loop
+        (review, review_done), (get_response, get_done) = await asyncio.gather(
+            timed(ac.post(f"/tasks/{t1_id}/review")),
+            timed(ac.get(f"/tasks/{t2_id}")),
+        )
 
-    app.dependency_overrides.clear()
+    assert review.status_code == 200
+    assert get_response.status_code == 200
+    assert get_done < review_done  # the read did not wait for the reviewer
 
 
-def test_no_reviewer_no_review_notes():
+def test_no_reviewer_no_review_notes(serve_board):
     """Test that review_notes remains None when no reviewer is configured."""
-    with tempfile.NamedTemporaryFile(delete=False, suffix=".json") as f:
-        temp_path = Path(f.name)
-
-    temp_path.unlink()
-
-    from kanban.api import get_board
-
-    app.dependency_overrides[get_board] = lambda: AsyncKanbanBoard(
-        persist_path=temp_path
-    )
-
-    with TestClient(app) as test_client:
-        task = test_client.post(
-            "/tasks", json={"title": "No Reviewer", "description": "Test"}
-        )
-        task_id = task.json()["id"]
+    client = serve_board(AsyncKanbanBoard(persist_path=None))
 
-        test_client.post(f"/tasks/{task_id}/start")
-        test_client.post(f"/tasks/{task_id}/review")
+    task = client.post("/tasks", json={"title": "No Reviewer", "description": "Test"})
+    task_id = task.json()["id"]
 
-        response = test_client.get(f"/tasks/{task_id}")
-        assert response.status_code == 200
-        assert response.json()["review_notes"] is None
+    client.post(f"/tasks/{task_id}/start")
+    client.post(f"/tasks/{task_id}/review")
 
-    app.dependency_overrides.clear()
+    response = client.get(f"/tasks/{task_id}")
+    assert response.status_code == 200
+    assert response.json()["review_notes"] is None
 
 
-def test_reviewer_persists_to_disk():
+def test_reviewer_persists_to_disk(tmp_path):
     """Test that review_notes are persisted to disk."""
-    with tempfile.NamedTemporaryFile(delete=False, suffix=".json") as f:
-        temp_path = Path(f.name)
-
-    temp_path.unlink()
-
-    from kanban.api import get_board
+    temp_path = tmp_path / "board.json"
 
     app.dependency_overrides[get_board] = lambda: AsyncKanbanBoard(
         persist_path=temp_path, reviewer=async_mock_reviewer
@@ -633,18 +666,10 @@ def test_reviewer_persists_to_disk():
         assert response.status_code == 200
         assert response.json()["review_notes"] == review_notes
 
-    app.dependency_overrides.clear()
-
 
-def test_reject_task(client):
+def test_reject_task(client, task_in_stage):
     """Test POST /tasks/{id}/reject endpoint."""
-    task_response = client.post(
-        "/tasks", json={"title": "Reject Test", "description": "Test rejection"}
-    )
-    task_id = task_response.json()["id"]
-
-    client.post(f"/tasks/{task_id}/start")
-    client.post(f"/tasks/{task_id}/review")
+    task_id = task_in_stage("review")
 
     reject_response = client.post(
         f"/tasks/{task_id}/reject", json={"reason": "Need more work"}
@@ -659,12 +684,9 @@ def test_reject_task(client):
     assert task["retry_count"] == 1
 
 
-def test_reject_task_invalid_stage(client):
+def test_reject_task_invalid_stage(client, task_in_stage):
     """Test rejecting a task not in review stage raises error."""
-    task_response = client.post(
-        "/tasks", json={"title": "Invalid Stage", "description": "Test invalid stage"}
-    )
-    task_id = task_response.json()["id"]
+    task_id = task_in_stage("backlog")
 
     reject_response = client.post(
         f"/tasks/{task_id}/reject", json={"reason": "Can't reject"}
@@ -716,15 +738,9 @@ def test_reject_frees_wip_slot(client_wip_1):
     assert start_response.status_code == 200
 
 
-def test_reject_records_audit_entry(client):
+def test_reject_records_audit_entry(client, task_in_stage):
     """Test that rejection records an audit entry with the reason."""
-    task_response = client.post(
-        "/tasks", json={"title": "Audit Test", "description": "Test audit entry"}
-    )
-    task_id = task_response.json()["id"]
-
-    client.post(f"/tasks/{task_id}/start")
-    client.post(f"/tasks/{task_id}/review")
+    task_id = task_in_stage("review")
 
     reason = "Code needs refactoring"
     client.post(f"/tasks/{task_id}/reject", json={"reason": reason})
@@ -744,15 +760,9 @@ def test_reject_records_audit_entry(client):
     assert reject_entry["note"] == reason
 
 
-def test_reject_reason_validation(client):
+def test_reject_reason_validation(client, task_in_stage):
     """Test that reject endpoint validates reason field."""
-    task_response = client.post(
-        "/tasks", json={"title": "Validation Test", "description": "Test validation"}
-    )
-    task_id = task_response.json()["id"]
-
-    client.post(f"/tasks/{task_id}/start")
-    client.post(f"/tasks/{task_id}/review")
+    task_id = task_in_stage("review")
 
     # Empty reason should fail
     reject_response = client.post(f"/tasks/{task_id}/reject", json={"reason": ""})
@@ -765,23 +775,17 @@ def test_reject_reason_validation(client):
     assert reject_response.status_code == 422
 
 
-def test_reject_task_not_found(client):
+def test_reject_task_not_found(readonly_client):
     """Test rejecting a non-existent task returns 404."""
-    reject_response = client.post(
+    reject_response = readonly_client.post(
         "/tasks/nonexistent/reject", json={"reason": "Does not exist"}
     )
     assert reject_response.status_code == 404
 
 
-def test_board_view_shows_rejected_tasks_in_backlog(client):
+def test_board_view_shows_rejected_tasks_in_backlog(client, task_in_stage):
     """Test that rejected tasks appear correctly in board view."""
-    task_response = client.post(
-        "/tasks", json={"title": "Board View Test", "description": "Test board view"}
-    )
-    task_id = task_response.json()["id"]
-
-    client.post(f"/tasks/{task_id}/start")
-    client.post(f"/tasks/{task_id}/review")
+    task_id = task_in_stage("review")
     client.post(f"/tasks/{task_id}/reject", json={"reason": "Retry"})
 
     board_response = client.get("/board")
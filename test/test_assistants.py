@@ -0,0 +1,157 @@
+"""Tests for kanban.assistants: AsyncBatcher and the shared Claude client."""
+
+import asyncio
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from kanban import assistants
+from kanban.assistants import AsyncBatcher
+from kanban.board import AsyncKanbanBoard
+
+
+@pytest.mark.asyncio
+async def test_batcher_coalesces_concurrent_calls():
+    """Test concurrent calls share one batch call and get their own results."""
+    batches = []
+
+    async def upper_batch(descriptions):
+        batches.append(list(descriptions))
+        return [d.upper() for d in descriptions]
+
+    batcher = AsyncBatcher(upper_batch, max_batch=8, max_wait_ms=10)
+    results = await asyncio.gather(*(batcher(f"task {i}") for i in range(3)))
+
+    assert results == ["TASK 0", "TASK 1", "TASK 2"]
+    assert batches == [["task 0", "task 1", "task 2"]]
+
+
+@pytest.mark.asyncio
+async def test_batcher_splits_at_max_batch():
+    """Test a burst larger than max_batch is split into several calls."""
+    batches = []
+
+    async def echo_batch(descriptions):
+        batches.append(len(descriptions))
+        return list(descriptions)
+
+    batcher = AsyncBatcher(echo_batch, max_batch=2, max_wait_ms=10)
+    results = await asyncio.gather(*(batcher(str(i)) for i in range(5)))
+
+    assert results == ["0", "1", "2", "3", "4"]
+    assert batches == [2, 2, 1]
+
+
+@pytest.mark.asyncio
+async def test_batcher_propagates_errors_to_every_caller():
+    """Test a failing batch call fails each waiting caller."""
+
+    async def broken_batch(descriptions):
+        return descriptions[:1]  # wrong length
+
+    batcher = AsyncBatcher(broken_batch, max_wait_ms=1)
+    results = await asyncio.gather(batcher("a"), batcher("b"), return_exceptions=True)
+
+    assert all(isinstance(r, ValueError) for r in results)
+
+
+@pytest.mark.asyncio
+async def test_batcher_cancelled_batch_cancels_callers():
+    """Test cancelling an in-flight batch call does not leave callers hanging."""
+    started = asyncio.Event()
+
+    async def stuck_batch(descriptions):
+        started.set()
+        await asyncio.Event().wait()
+
+    batcher = AsyncBatcher(stuck_batch, max_batch=2)
+    callers = [asyncio.ensure_future(batcher(d)) for d in "ab"]
+    await started.wait()
+    for task in list(batcher._batches[asyncio.get_running_loop()].running):
+        task.cancel()
+
+    results = await asyncio.wait_for(
+        asyncio.gather(*callers, return_exceptions=True), timeout=1
+    )
+    assert all(isinstance(r, asyncio.CancelledError) for r in results)
+
+
+def test_batcher_outlives_a_closed_loop():
+    """Test a loop closing with a dispatch timer armed does not stall later loops."""
+
+    async def echo_batch(descriptions):
+        return descriptions
+
+    batcher = AsyncBatcher(echo_batch, max_wait_ms=50)
+
+    async def abandon_call():
+        caller = asyncio.ensure_future(batcher("old"))
+        await asyncio.sleep(0)
+        caller.cancel()  # leaves the batcher's timer armed on this loop
+
+    old_loop = asyncio.new_event_loop()
+    old_loop.run_until_complete(abandon_call())
+    old_loop.close()
+
+    assert asyncio.run(asyncio.wait_for(batcher("new"), timeout=1)) == "new"
+
+
+@pytest.mark.asyncio
+async def test_batcher_works_as_board_assistant():
+    """Test a batcher can be injected into the board like any assistant."""
+
+    async def snippet_batch(descriptions):
+        return [f"# {d}" for d in descriptions]
+
+    board = AsyncKanbanBoard(
+        assistant=AsyncBatcher(snippet_batch, max_wait_ms=1), persist_path=None
+    )
+    t1 = await board.create_task("T1", "first")
+    t2 = await board.create_task("T2", "second")
+
+    await asyncio.gather(
+        board.move_to_in_progress(t1.id), board.move_to_in_progress(t2.id)
+    )
+
+    assert t1.code_snippet == "# first"
+    assert t2.code_snippet == "# second"
+
+
+class _FakeAnthropic:
+    """Stands in for anthropic.AsyncAnthropic; counts instances."""
+
+    created = 0
+
+    def __init__(self):
+        type(self).created += 1
+        self.closed = False
+        self.messages = types.SimpleNamespace(create=self._create)
+
+    async def _create(self, **kwargs):
+        return types.SimpleNamespace(content=[types.SimpleNamespace(text="ok")])
+
+    async def close(self):
+        self.closed = True
+
+
+@pytest.mark.asyncio
+async def test_claude_client_is_reused_and_closed(monkeypatch):
+    """Test calls on one loop share a client until close_claude_client()."""
+    monkeypatch.setitem(
+        sys.modules, "anthropic", types.SimpleNamespace(AsyncAnthropic=_FakeAnthropic)
+    )
+    monkeypatch.setattr(_FakeAnthropic, "created", 0)
+
+    await assistants.async_claude_assistant("first")
+    await assistants.async_claude_assistant("second")
+    client = assistants._claude_client()
+    assert _FakeAnthropic.created == 1
+
+    await assistants.close_claude_client()
+    assert client.closed
+    await assistants.async_claude_assistant("third")
+    assert _FakeAnthropic.created == 2
+    await assistants.close_claude_client()
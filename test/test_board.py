@@ -2,34 +2,15 @@
 
 import asyncio
 import sys
-import tempfile
 from pathlib import Path
 
 import pytest
-import pytest_asyncio
 
 sys.path.append(str(Path(__file__).resolve().parent.parent))
-from kanban.board import AsyncKanbanBoard, stale_task_monitor
+from kanban.board import AsyncKanbanBoard, check_stale_tasks
 from kanban.domain import AuditEntry
 from kanban.domain import Stage as KanbanStage
-
-
-@pytest.fixture
-def temp_persist_path():
-    """Create a temporary file path for board persistence."""
-    with tempfile.NamedTemporaryFile(delete=False, suffix=".json") as f:
-        path = Path(f.name)
-    yield path
-    if path.exists():
-        path.unlink()
-
-
-@pytest_asyncio.fixture
-async def board(temp_persist_path):
-    """Create a fresh board for each test."""
-    if temp_persist_path.exists():
-        temp_persist_path.unlink()
-    return AsyncKanbanBoard(persist_path=temp_persist_path)
+from kanban.persistence import JournalStore
 
 
 @pytest.mark.asyncio
@@ -43,29 +24,13 @@ async def test_find_stale_no_stale_tasks(board):
 
 
 @pytest.mark.asyncio
-async def test_find_stale_with_stale_task(board):
+async def test_find_stale_with_stale_task(board, backdate_in_progress):
     """Test find_stale correctly identifies stale IN_PROGRESS tasks."""
-    from datetime import datetime, timezone
-
     task = await board.create_task("Stale Task", "Will become stale")
     await board.move_to_in_progress(task.id)
 
     # Manually set the transition time to be old
-    for entry in reversed(task.history):
-        if entry.to_stage == KanbanStage.IN_PROGRESS:
-            old_time = datetime.now(timezone.utc).timestamp() - 400
-            task.history.remove(entry)
-            task.history.append(
-                AuditEntry(
-                    from_stage=entry.from_stage,
-                    to_stage=entry.to_stage,
-                    timestamp=datetime.fromtimestamp(
-                        old_time, tz=timezone.utc
-                    ).isoformat(),
-                    note=entry.note,
-                )
-            )
-            break
+    backdate_in_progress(task, 400)
 
     stale = board.find_stale(threshold_seconds=300)
     assert len(stale) == 1
@@ -73,7 +38,7 @@ async def test_find_stale_with_stale_task(board):
 
 
 @pytest.mark.asyncio
-async def test_find_stale_ignores_non_in_progress(board):
+async def test_find_stale_ignores_non_in_progress(board, backdate_in_progress):
     """Test find_stale ignores tasks not in IN_PROGRESS stage."""
     t1 = await board.create_task("Task 1", "Desc 1")
     t2 = await board.create_task("Task 2", "Desc 2")
@@ -87,23 +52,7 @@ async def test_find_stale_ignores_non_in_progress(board):
     await board.move_to_in_progress(t2.id)
 
     # Set t2 as stale
-    from datetime import datetime, timezone
-
-    for entry in reversed(t2.history):
-        if entry.to_stage == KanbanStage.IN_PROGRESS:
-            old_time = datetime.now(timezone.utc).timestamp() - 400
-            t2.history.remove(entry)
-            t2.history.append(
-                AuditEntry(
-                    from_stage=entry.from_stage,
-                    to_stage=entry.to_stage,
-                    timestamp=datetime.fromtimestamp(
-                        old_time, tz=timezone.utc
-                    ).isoformat(),
-                    note=entry.note,
-                )
-            )
-            break
+    backdate_in_progress(t2, 400)
 
     stale = board.find_stale(threshold_seconds=300)
     assert len(stale) == 1
@@ -111,7 +60,9 @@ async def test_find_stale_ignores_non_in_progress(board):
 
 
 @pytest.mark.asyncio
-async def test_find_stale_uses_audit_timestamp_not_created_at(board):
+async def test_find_stale_uses_audit_timestamp_not_created_at(
+    board, backdate_in_progress
+):
     """Test find_stale uses audit trail timestamp, not task.created_at."""
     from datetime import datetime, timedelta, timezone
 
@@ -129,21 +80,7 @@ async def test_find_stale_uses_audit_timestamp_not_created_at(board):
     assert len(stale) == 0
 
     # Now make the IN_PROGRESS transition old
-    for entry in reversed(task.history):
-        if entry.to_stage == KanbanStage.IN_PROGRESS:
-            old_time = datetime.now(timezone.utc).timestamp() - 400
-            task.history.remove(entry)
-            task.history.append(
-                AuditEntry(
-                    from_stage=entry.from_stage,
-                    to_stage=entry.to_stage,
-                    timestamp=datetime.fromtimestamp(
-                        old_time, tz=timezone.utc
-                    ).isoformat(),
-                    note=entry.note,
-                )
-            )
-            break
+    backdate_in_progress(task, 400)
 
     # Now task should be stale
     stale = board.find_stale(threshold_seconds=300)
@@ -151,12 +88,9 @@ async def test_find_stale_uses_audit_timestamp_not_created_at(board):
 
 
 @pytest.mark.asyncio
-async def test_stale_monitor(board):
+async def test_stale_monitor(board, backdate_in_progress):
     """Test stale monitor detects stale tasks and fires hooks."""
-    from datetime import datetime, timezone
-
     threshold = 1  # 1 second
-    poll_interval = 1  # 1 second
 
     task = await board.create_task("Stale Task", "Will become stale")
     await board.move_to_in_progress(task.id)
@@ -169,43 +103,18 @@ async def test_stale_monitor(board):
     board._hook_registry.register("on_stale_task", track_stale)
 
     # Set the transition time to be old
-    for entry in reversed(task.history):
-        if entry.to_stage == KanbanStage.IN_PROGRESS:
-            old_time = datetime.now(timezone.utc).timestamp() - 2
-            task.history.remove(entry)
-            task.history.append(
-                AuditEntry(
-                    from_stage=entry.from_stage,
-                    to_stage=entry.to_stage,
-                    timestamp=datetime.fromtimestamp(
-                        old_time, tz=timezone.utc
-                    ).isoformat(),
-                    note=entry.note,
-                )
-            )
-            break
-
-    # Start monitor, wait for detection, then cancel
-    monitor = asyncio.create_task(stale_task_monitor(board, threshold, poll_interval))
-    await asyncio.sleep(2)  # Wait for at least one poll cycle
-    monitor.cancel()
-
-    try:
-        await monitor
-    except asyncio.CancelledError:
-        pass
-
-    assert len(hook_calls) >= 1
-    assert task.id in hook_calls
+    backdate_in_progress(task, 2)
+
+    # One poll of the monitor, without waiting out its interval
+    await check_stale_tasks(board, threshold)
+
+    assert hook_calls == [task.id]
 
 
 @pytest.mark.asyncio
-async def test_stale_monitor_respects_stage_changes(board):
+async def test_stale_monitor_respects_stage_changes(board, backdate_in_progress):
     """Test that tasks moved out of IN_PROGRESS are no longer considered stale."""
-    from datetime import datetime, timezone
-
     threshold = 1  # 1 second
-    poll_interval = 1  # 1 second
 
     task = await board.create_task("Task", "Will move to review")
     await board.move_to_in_progress(task.id)
@@ -218,55 +127,33 @@ async def test_stale_monitor_respects_stage_changes(board):
     board._hook_registry.register("on_stale_task", track_stale)
 
     # Set the transition time to be old
-    for entry in reversed(task.history):
-        if entry.to_stage == KanbanStage.IN_PROGRESS:
-            old_time = datetime.now(timezone.utc).timestamp() - 2
-            task.history.remove(entry)
-            task.history.append(
-                AuditEntry(
-                    from_stage=entry.from_stage,
-                    to_stage=entry.to_stage,
-                    timestamp=datetime.fromtimestamp(
-                        old_time, tz=timezone.utc
-                    ).isoformat(),
-                    note=entry.note,
-                )
-            )
-            break
-
-    # Start monitor
-    monitor = asyncio.create_task(stale_task_monitor(board, threshold, poll_interval))
-    await asyncio.sleep(1.5)  # Wait for at least one poll cycle
+    backdate_in_progress(task, 2)
+
+    await check_stale_tasks(board, threshold)
+    assert hook_calls == [task.id]
 
     # Move task to REVIEW - should stop being stale
     await board.move_to_review(task.id)
+    hook_calls.clear()
 
-    await asyncio.sleep(1.5)  # Wait for another poll cycle
-    monitor.cancel()
-
-    try:
-        await monitor
-    except asyncio.CancelledError:
-        pass
-
-    # Hook should have fired at least once before we moved the task
-    assert len(hook_calls) >= 1
+    await check_stale_tasks(board, threshold)
+    assert hook_calls == []
 
 
 @pytest.mark.asyncio
-async def test_stale_monitor_handles_multiple_stale_tasks(board):
+async def test_stale_monitor_handles_multiple_stale_tasks(board, backdate_in_progress):
     """Test monitor fires hook for each stale task."""
-    from datetime import datetime, timezone
-
     threshold = 2  # 2 seconds
-    poll_interval = 1  # 1 second
 
-    t1 = await board.create_task("Task 1", "Stale 1")
-    t2 = await board.create_task("Task 2", "Stale 2")
-    t3 = await board.create_task("Task 3", "Fresh")
+    t1, t2, t3 = await asyncio.gather(
+        board.create_task("Task 1", "Stale 1"),
+        board.create_task("Task 2", "Stale 2"),
+        board.create_task("Task 3", "Fresh"),
+    )
 
-    await board.move_to_in_progress(t1.id)
-    await board.move_to_in_progress(t2.id)
+    await asyncio.gather(
+        board.move_to_in_progress(t1.id), board.move_to_in_progress(t2.id)
+    )
 
     hook_calls = []
 
@@ -277,36 +164,295 @@ async def test_stale_monitor_handles_multiple_stale_tasks(board):
 
     # Make t1 and t2 old (3 seconds ago, exceeding the 2-second threshold)
     for task in [t1, t2]:
-        for entry in reversed(task.history):
-            if entry.to_stage == KanbanStage.IN_PROGRESS:
-                old_time = datetime.now(timezone.utc).timestamp() - 3
-                task.history.remove(entry)
-                task.history.append(
-                    AuditEntry(
-                        from_stage=entry.from_stage,
-                        to_stage=entry.to_stage,
-                        timestamp=datetime.fromtimestamp(
-                            old_time, tz=timezone.utc
-                        ).isoformat(),
-                        note=entry.note,
-                    )
-                )
-                break
+        backdate_in_progress(task, 3)
 
     # Move t3 to IN_PROGRESS last so it's naturally fresh (will be < 2 seconds old when checked)
     await board.move_to_in_progress(t3.id)
 
-    # Start monitor
-    monitor = asyncio.create_task(stale_task_monitor(board, threshold, poll_interval))
-    await asyncio.sleep(1.5)  # Wait for at least one poll cycle
-    monitor.cancel()
+    stale = await check_stale_tasks(board, threshold)
+
+    assert {t.id for t in stale} == {t1.id, t2.id}
+    assert sorted(hook_calls) == sorted([t1.id, t2.id])
+
+
+@pytest.mark.asyncio
+async def test_stage_index_tracks_transitions(disk_board, temp_persist_path):
+    """Test the per-stage index follows every transition and survives reload."""
+    t1 = await disk_board.create_task("Task 1", "Desc 1")
+    t2 = await disk_board.create_task("Task 2", "Desc 2")
+
+    await disk_board.move_to_in_progress(t1.id)
+    await disk_board.move_to_review(t1.id)
+    await disk_board.reject(t1.id, "Try again")
+    await disk_board.move_to_in_progress(t2.id)
+
+    assert [t.id for t in disk_board.tasks_by_stage(KanbanStage.BACKLOG)] == [t1.id]
+    assert [t.id for t in disk_board.tasks_by_stage(KanbanStage.IN_PROGRESS)] == [t2.id]
+    assert disk_board.tasks_by_stage(KanbanStage.REVIEW) == []
+    assert disk_board._count_stage(KanbanStage.IN_PROGRESS) == 1
+
+    reloaded = AsyncKanbanBoard(persist_path=temp_persist_path)
+    assert [t.id for t in reloaded.tasks_by_stage(KanbanStage.BACKLOG)] == [t1.id]
+    assert reloaded._count_stage(KanbanStage.IN_PROGRESS) == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_saves_are_coalesced(
+    disk_board, temp_persist_path, monkeypatch
+):
+    """Test a burst of mutations is persisted in a handful of writes, not one each."""
+    writes = []
+    original_append = JournalStore.append
+
+    def counting_append(self, records, durable=False):
+        writes.append(len(records))
+        return original_append(self, records, durable)
+
+    monkeypatch.setattr(JournalStore, "append", counting_append)
+
+    await asyncio.gather(*(disk_board.create_task(f"T{i}", f"D{i}") for i in range(10)))
+
+    assert 1 <= len(writes) <= 2
+    assert sum(writes) == 10
+    reloaded = AsyncKanbanBoard(persist_path=temp_persist_path)
+    assert len(reloaded.all_tasks()) == 10
+
+
+@pytest.mark.asyncio
+async def test_debounced_writes_land_in_one_append(tmp_path, monkeypatch):
+    """Test persist_debounce_ms holds a run of mutations for a single write."""
+    writes = []
+    original_append = JournalStore.append
+
+    def counting_append(self, records, durable=False):
+        writes.append(len(records))
+        return original_append(self, records, durable)
+
+    monkeypatch.setattr(JournalStore, "append", counting_append)
+    board = AsyncKanbanBoard(
+        persist_path=tmp_path / "board.json", persist_debounce_ms=1000
+    )
+
+    t1 = await board.create_task("Task 1", "Desc 1")
+    t2 = await board.create_task("Task 2", "Desc 2")
+    await board.move_to_in_progress(t1.id)
+    assert writes == []
+
+    await board.flush()
+    assert writes == [2]
+
+    # A durable change is written at once, along with anything pending
+    await board.move_to_in_progress(t2.id)
+    await board.move_to_review(t1.id)
+    await board.approve(t1.id)
+    assert writes == [2, 2]
+
+
+def test_task_to_dict_matches_dataclass_fields():
+    """Test the hand-rolled serializer covers every persisted Task field."""
+    import json
+    from dataclasses import asdict
+
+    from kanban.domain import Task
+
+    task = Task(title="T", description="D", depends_on=["a"], review_notes="ok")
+    task.history.append(AuditEntry(from_stage=None, to_stage=KanbanStage.BACKLOG))
+    task.history.append(
+        AuditEntry(
+            from_stage=KanbanStage.BACKLOG, to_stage=KanbanStage.IN_PROGRESS, note="n"
+        )
+    )
+
+    expected = asdict(task)
+    # asdict only recurses into lists, and history is a deque
+    expected["history"] = [asdict(e) for e in task.history]
+    expected = json.loads(json.dumps(expected))
+    del expected["version"], expected["in_progress_since"]
+    assert task.to_dict() == expected
+
+
+@pytest.mark.asyncio
+async def test_task_lock_serialises_same_task_only():
+    """Test a slow assistant blocks its own task's review but not other tasks."""
+    release = asyncio.Event()
+
+    async def slow_assistant(description):
+        if description == "slow":
+            await release.wait()
+        return f"# {description}"
+
+    board = AsyncKanbanBoard(assistant=slow_assistant, persist_path=None)
+    slow = await board.create_task("Slow", "slow")
+    other = await board.create_task("Other", "other")
 
-    try:
-        await monitor
-    except asyncio.CancelledError:
-        pass
+    starting = asyncio.create_task(board.move_to_in_progress(slow.id))
+    await asyncio.sleep(0)
+    reviewing = asyncio.create_task(board.move_to_review(slow.id))
 
-    assert len(hook_calls) >= 2
-    assert t1.id in hook_calls
-    assert t2.id in hook_calls
-    assert t3.id not in hook_calls
+    # A different task moves freely while the slow assistant is running
+    await asyncio.wait_for(board.move_to_in_progress(other.id), timeout=1)
+    await asyncio.wait_for(board.move_to_review(other.id), timeout=1)
+    assert not reviewing.done()
+
+    release.set()
+    await starting
+    reviewed = await reviewing
+
+    # The review waited for the snippet instead of racing past it
+    assert reviewed.stage == KanbanStage.REVIEW
+    assert reviewed.code_snippet == "# slow"
+
+
+def test_domain_objects_use_slots():
+    """Test Task and AuditEntry carry no per-instance __dict__."""
+    from kanban.domain import Task
+
+    task = Task(title="T", description="D")
+    entry = AuditEntry(from_stage=None, to_stage=KanbanStage.BACKLOG)
+
+    assert not hasattr(task, "__dict__")
+    assert not hasattr(entry, "__dict__")
+    with pytest.raises(AttributeError):
+        task.not_a_field = 1
+
+
+def test_audit_entry_is_frozen():
+    """Test audit entries cannot be altered once recorded."""
+    from dataclasses import FrozenInstanceError
+
+    entry = AuditEntry(from_stage=None, to_stage=KanbanStage.BACKLOG, note="created")
+
+    with pytest.raises(FrozenInstanceError):
+        entry.note = "edited"
+    assert hash(entry) == hash(
+        AuditEntry(None, KanbanStage.BACKLOG, entry.timestamp, "created")
+    )
+
+
+@pytest.mark.asyncio
+async def test_snapshot_groups_every_stage(board):
+    """Test snapshot returns one list per stage, including empty ones."""
+    t1 = await board.create_task("Task 1", "Desc 1")
+    await board.create_task("Task 2", "Desc 2")
+    await board.move_to_in_progress(t1.id)
+
+    snapshot = board.snapshot()
+
+    assert list(snapshot) == list(KanbanStage)
+    assert len(snapshot[KanbanStage.BACKLOG]) == 1
+    assert [t.id for t in snapshot[KanbanStage.IN_PROGRESS]] == [t1.id]
+    assert snapshot[KanbanStage.DONE] == []
+
+
+@pytest.mark.asyncio
+async def test_create_task_id_and_timestamps(board):
+    """Test ids keep their 8-hex-char shape and creation shares one timestamp."""
+    task = await board.create_task("Task", "Desc")
+
+    assert len(task.id) == 8
+    int(task.id, 16)
+    assert task.history[0].timestamp == task.created_at
+
+
+@pytest.mark.asyncio
+async def test_board_view_output(board, capsys):
+    """Test board_view prints every stage header followed by its tasks."""
+    t1 = await board.create_task("Task 1", "Desc 1")
+    await board.create_task("Task 2", "Desc 2")
+    await board.move_to_in_progress(t1.id)
+
+    board.board_view()
+    out = capsys.readouterr().out.splitlines()
+
+    assert out[:2] == ["", "── BACKLOG (1/∞) ──"]
+    assert out[2].startswith("  [") and "'Task 2'" in out[2]
+    assert "── IN_PROGRESS (1/3) ──" in out
+    assert out[-2:] == ["", "── DONE (0/∞) ──"]
+
+
+@pytest.mark.asyncio
+async def test_in_progress_since_tracks_stage(disk_board, temp_persist_path):
+    """Test the cached In-Progress time is set, cleared and rebuilt on load."""
+    task = await disk_board.create_task("Task", "Desc")
+    assert task.in_progress_since is None
+
+    await disk_board.move_to_in_progress(task.id)
+    since = task.in_progress_since
+    assert since is not None
+
+    reloaded = AsyncKanbanBoard(persist_path=temp_persist_path)
+    assert reloaded.get_task(task.id).in_progress_since == pytest.approx(since, abs=1)
+
+    await disk_board.move_to_review(task.id)
+    assert task.in_progress_since is None
+
+
+@pytest.mark.asyncio
+async def test_dependencies_unblock_on_approve(disk_board, temp_persist_path):
+    """Test a dependent is blocked until every dependency is approved."""
+    from kanban.domain import UnresolvedDependencyError
+
+    dep1 = await disk_board.create_task("Dep 1", "Desc")
+    dep2 = await disk_board.create_task("Dep 2", "Desc")
+    task = await disk_board.create_task("Task", "Desc", depends_on=[dep1.id, dep2.id])
+
+    for dep in (dep1, dep2):
+        await disk_board.move_to_in_progress(dep.id)
+        await disk_board.move_to_review(dep.id)
+
+    await disk_board.approve(dep1.id)
+    with pytest.raises(UnresolvedDependencyError) as exc_info:
+        await disk_board.move_to_in_progress(task.id)
+    assert exc_info.value.blocking == [dep2.id]
+
+    # Counts are rebuilt from disk, whatever order tasks are loaded in
+    reloaded = AsyncKanbanBoard(persist_path=temp_persist_path)
+    await disk_board.approve(dep2.id)
+    await reloaded.approve(dep2.id)
+
+    assert (
+        await disk_board.move_to_in_progress(task.id)
+    ).stage is KanbanStage.IN_PROGRESS
+    moved = await reloaded.move_to_in_progress(task.id)
+    assert moved.stage is KanbanStage.IN_PROGRESS
+
+
+@pytest.mark.asyncio
+async def test_ready_tasks_follow_dependencies(board):
+    """Test ready_tasks lists only Backlog tasks with every dependency Done."""
+    dep = await board.create_task("Dep", "Desc")
+    free = await board.create_task("Free", "Desc")
+    blocked = await board.create_task("Blocked", "Desc", depends_on=[dep.id])
+    assert board.ready_tasks() == [dep, free]
+
+    await board.move_to_in_progress(dep.id)
+    await board.move_to_review(dep.id)
+    assert board.ready_tasks() == [free]
+
+    await board.approve(dep.id)
+    assert board.ready_tasks() == [free, blocked]
+
+    await board.move_to_in_progress(blocked.id)
+    await board.move_to_review(blocked.id)
+    await board.reject(blocked.id, "again")
+    assert board.ready_tasks() == [free, blocked]
+
+
+@pytest.mark.asyncio
+async def test_history_is_bounded(disk_board, temp_persist_path, monkeypatch):
+    """Test only the newest HISTORY_LIMIT audit entries are kept, on load too."""
+    import kanban.domain
+
+    monkeypatch.setattr(kanban.domain, "HISTORY_LIMIT", 4)
+    monkeypatch.setattr("kanban.board.HISTORY_LIMIT", 4)
+    task = await disk_board.create_task("Task", "Desc")
+    for i in range(3):
+        await disk_board.move_to_in_progress(task.id)
+        await disk_board.move_to_review(task.id)
+        await disk_board.reject(task.id, f"round {i}")
+
+    assert len(task.history) == 4
+    assert task.history[-1].note == "round 2"
+
+    reloaded = AsyncKanbanBoard(persist_path=temp_persist_path)
+    assert list(reloaded.get_task(task.id).history) == list(task.history)
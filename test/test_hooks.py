@@ -2,38 +2,28 @@
 
 import asyncio
 import sys
-import tempfile
 from pathlib import Path
 
 import pytest
-import pytest_asyncio
+from loguru import logger
 
 sys.path.append(str(Path(__file__).resolve().parent.parent))
-from kanban.board import AsyncKanbanBoard
-from kanban.domain import Stage
+from kanban.board import AsyncKanbanBoard, check_stale_tasks
+from kanban.domain import Stage, Task
 from kanban.hooks import AsyncHookFn, HookRegistry, log_transition
 
 
 @pytest.fixture
-def temp_persist_path():
-    """Create a temporary file path for board persistence."""
-    with tempfile.NamedTemporaryFile(delete=False, suffix=".json") as f:
-        path = Path(f.name)
-    yield path
-    if path.exists():
-        path.unlink()
+def hooks_board():
+    """Factory building an in-memory board with the given hooks registered."""
 
+    def _make(**hooks: list[AsyncHookFn]) -> AsyncKanbanBoard:
+        return AsyncKanbanBoard(persist_path=None, hooks=hooks)
 
-@pytest_asyncio.fixture
-async def board(temp_persist_path):
-    """Create a fresh board for each test."""
-    if temp_persist_path.exists():
-        temp_persist_path.unlink()
-    return AsyncKanbanBoard(persist_path=temp_persist_path)
+    return _make
 
 
-@pytest.mark.asyncio
-async def test_hook_registry_initialization():
+def test_hook_registry_initialization():
     """Test HookRegistry initializes with correct events."""
     registry = HookRegistry()
     assert "on_transition" in registry._hooks
@@ -41,8 +31,7 @@ async def test_hook_registry_initialization():
     assert "on_stale_task" in registry._hooks
 
 
-@pytest.mark.asyncio
-async def test_hook_register():
+def test_hook_register():
     """Test registering a hook."""
     registry = HookRegistry()
 
@@ -53,8 +42,7 @@ async def test_hook_register():
     assert my_hook in registry._hooks["on_transition"]
 
 
-@pytest.mark.asyncio
-async def test_hook_register_invalid_event():
+def test_hook_register_invalid_event():
     """Test registering a hook with invalid event raises ValueError."""
     registry = HookRegistry()
 
@@ -77,8 +65,6 @@ async def test_hook_fire():
 
     registry.register("on_transition", my_hook)
 
-    from kanban.domain import Task
-
     task = Task(title="Test", description="Test")
     await registry.fire("on_transition", task)
 
@@ -100,12 +86,17 @@ async def test_hook_error_does_not_crash():
     registry.register("on_transition", failing_hook)
     registry.register("on_transition", working_hook)
 
-    from kanban.domain import Task
-
     task = Task(title="Test", description="Test")
 
-    # Should not raise
-    await registry.fire("on_transition", task)
+    errors = []
+    sink_id = logger.add(errors.append, level="ERROR", format="{message}")
+    try:
+        # Should not raise
+        await registry.fire("on_transition", task)
+    finally:
+        logger.remove(sink_id)
+
+    assert errors == ["Hook on_transition failed: Hook failed!\n"]
 
 
 @pytest.mark.asyncio
@@ -120,75 +111,41 @@ async def test_board_accepts_hooks_at_init():
     board = AsyncKanbanBoard(persist_path=None, hooks=hooks)
 
     task = await board.create_task("Test", "Desc")
-    await asyncio.sleep(0.01)  # Allow hook to execute
-
-    assert len(call_count) == 1
-    assert call_count[0] == Stage.BACKLOG
-
-
-@pytest.mark.asyncio
-async def test_on_transition_fired_on_create_task():
-    """Test that on_transition is fired when task is created."""
-    call_count = []
-
-    async def my_hook(task):
-        call_count.append(task.stage)
-
-    hooks = {"on_transition": [my_hook]}
-    board = AsyncKanbanBoard(persist_path=None, hooks=hooks)
-
-    await board.create_task("Test", "Desc")
-    await asyncio.sleep(0.01)  # Allow hook to execute
 
     assert len(call_count) == 1
     assert call_count[0] == Stage.BACKLOG
 
 
+@pytest.mark.parametrize(
+    "methods,expected",
+    [
+        ([], Stage.BACKLOG),
+        (["move_to_in_progress"], Stage.IN_PROGRESS),
+        (["move_to_in_progress", "move_to_review"], Stage.REVIEW),
+        (["move_to_in_progress", "move_to_review", "approve"], Stage.DONE),
+    ],
+    ids=["create_task", "move_to_in_progress", "move_to_review", "approve"],
+)
 @pytest.mark.asyncio
-async def test_on_transition_fired_on_move_to_in_progress():
-    """Test that on_transition is fired when task moves to in_progress."""
-    call_count = []
-
-    async def my_hook(task):
-        call_count.append(task.stage)
-
-    hooks = {"on_transition": [my_hook]}
-    board = AsyncKanbanBoard(persist_path=None, hooks=hooks)
-
-    task = await board.create_task("Test", "Desc")
-    call_count.clear()  # Clear the create hook call
-
-    await board.move_to_in_progress(task.id)
-    await asyncio.sleep(0.01)  # Allow hook to execute
-
-    assert len(call_count) == 1
-    assert call_count[0] == Stage.IN_PROGRESS
-
-
-@pytest.mark.asyncio
-async def test_on_transition_fired_on_move_to_review():
-    """Test that on_transition is fired when task moves to review."""
+async def test_on_transition_fired(hooks_board, methods, expected):
+    """Test that on_transition fires once, with the new stage, per transition."""
     call_count = []
 
     async def my_hook(task):
         call_count.append(task.stage)
 
-    hooks = {"on_transition": [my_hook]}
-    board = AsyncKanbanBoard(persist_path=None, hooks=hooks)
+    board = hooks_board(on_transition=[my_hook])
 
     task = await board.create_task("Test", "Desc")
-    await board.move_to_in_progress(task.id)
-    call_count.clear()  # Clear previous hook calls
-
-    await board.move_to_review(task.id)
-    await asyncio.sleep(0.01)  # Allow hook to execute
+    for method in methods:
+        call_count.clear()  # Only the last transition's calls count
+        await getattr(board, method)(task.id)
 
-    assert len(call_count) == 1
-    assert call_count[0] == Stage.REVIEW
+    assert call_count == [expected]
 
 
 @pytest.mark.asyncio
-async def test_on_done_fired_on_approve():
+async def test_on_done_fired_on_approve(hooks_board):
     """Test that on_done is fired when task is approved."""
     transition_count = []
     done_count = []
@@ -199,11 +156,7 @@ async def test_on_done_fired_on_approve():
     async def done_hook(task):
         done_count.append(task.stage)
 
-    hooks = {
-        "on_transition": [transition_hook],
-        "on_done": [done_hook],
-    }
-    board = AsyncKanbanBoard(persist_path=None, hooks=hooks)
+    board = hooks_board(on_transition=[transition_hook], on_done=[done_hook])
 
     task = await board.create_task("Test", "Desc")
     await board.move_to_in_progress(task.id)
@@ -211,7 +164,6 @@ async def test_on_done_fired_on_approve():
     transition_count.clear()  # Clear previous calls
 
     await board.approve(task.id)
-    await asyncio.sleep(0.01)  # Allow hooks to execute
 
     assert len(done_count) == 1
     assert done_count[0] == Stage.DONE
@@ -219,7 +171,7 @@ async def test_on_done_fired_on_approve():
 
 
 @pytest.mark.asyncio
-async def test_multiple_hooks_for_same_event():
+async def test_multiple_hooks_for_same_event(hooks_board):
     """Test that multiple hooks can be registered for the same event."""
     call_count = []
 
@@ -229,11 +181,9 @@ async def test_multiple_hooks_for_same_event():
     async def hook2(task):
         call_count.append(2)
 
-    hooks = {"on_transition": [hook1, hook2]}
-    board = AsyncKanbanBoard(persist_path=None, hooks=hooks)
+    board = hooks_board(on_transition=[hook1, hook2])
 
     await board.create_task("Test", "Desc")
-    await asyncio.sleep(0.01)  # Allow hooks to execute
 
     assert len(call_count) == 2
     assert 1 in call_count
@@ -241,37 +191,58 @@ async def test_multiple_hooks_for_same_event():
 
 
 @pytest.mark.asyncio
-async def test_hook_fires_after_lock_release():
+async def test_hook_fires_after_lock_release(hooks_board):
     """Test that hooks fire after the lock is released."""
     lock_acquired_count = []
+    board = hooks_board()
+    task_locks = board._task_locks
 
     async def lock_checking_hook(task):
         # Try to acquire the lock - should succeed since hook runs after lock release
-        async with board._lock:
+        async with task_locks[task.id]:
             lock_acquired_count.append(1)
 
-    hooks = {"on_transition": [lock_checking_hook]}
-    board = AsyncKanbanBoard(persist_path=None, hooks=hooks)
+    board._hook_registry.register("on_transition", lock_checking_hook)
 
     await board.create_task("Test", "Desc")
-    await asyncio.sleep(0.01)  # Allow hook to execute
 
     assert len(lock_acquired_count) == 1
 
 
 @pytest.mark.asyncio
-async def test_task_state_at_hook_call_time():
+async def test_review_hook_fires_before_reviewer_runs():
+    """Test on_transition for REVIEW fires as soon as the stage changes."""
+    events = []
+
+    async def hook(task):
+        events.append(("hook", task.stage))
+
+    async def reviewer(description, snippet):
+        events.append(("reviewer", None))
+        return "LGTM"
+
+    board = AsyncKanbanBoard(persist_path=None, reviewer=reviewer)
+    task = await board.create_task("Test", "Desc")
+    await board.move_to_in_progress(task.id)
+    board._hook_registry.register("on_transition", hook)
+
+    reviewed = await board.move_to_review(task.id)
+
+    assert events == [("hook", Stage.REVIEW), ("reviewer", None)]
+    assert reviewed.review_notes == "LGTM"
+
+
+@pytest.mark.asyncio
+async def test_task_state_at_hook_call_time(hooks_board):
     """Test that hook sees correct task state at call time."""
     captured_tasks = []
 
     async def capturing_hook(task):
         captured_tasks.append((task.id, task.stage))
 
-    hooks = {"on_transition": [capturing_hook]}
-    board = AsyncKanbanBoard(persist_path=None, hooks=hooks)
+    board = hooks_board(on_transition=[capturing_hook])
 
     task = await board.create_task("Test", "Desc")
-    await asyncio.sleep(0.01)
 
     assert len(captured_tasks) == 1
     assert captured_tasks[0][0] == task.id
@@ -279,80 +250,80 @@ async def test_task_state_at_hook_call_time():
 
     captured_tasks.clear()
     await board.move_to_in_progress(task.id)
-    await asyncio.sleep(0.01)
 
     assert len(captured_tasks) == 1
     assert captured_tasks[0][1] == Stage.IN_PROGRESS
 
 
 @pytest.mark.asyncio
-async def test_built_in_log_transition_hook():
+async def test_built_in_log_transition_hook(hooks_board):
     """Test the built-in log_transition hook."""
-    hooks = {"on_transition": [log_transition]}
-    board = AsyncKanbanBoard(persist_path=None, hooks=hooks)
+    board = hooks_board(on_transition=[log_transition])
 
     # Should not raise
     task = await board.create_task("Test", "Desc")
-    await asyncio.sleep(0.01)
 
     await board.move_to_in_progress(task.id)
-    await asyncio.sleep(0.01)
 
 
-@pytest.mark.asyncio
-async def test_on_stale_task_hook_registered():
+def test_on_stale_task_hook_registered():
     """Test that on_stale_task hook is registered in HookRegistry."""
     registry = HookRegistry()
     assert "on_stale_task" in registry._hooks
 
 
 @pytest.mark.asyncio
-async def test_on_stale_task_hook_fires():
+async def test_on_stale_task_hook_fires(hooks_board, backdate_in_progress):
     """Test that on_stale_task hook fires correctly."""
-    from datetime import datetime, timezone
-
-    from kanban.board import AsyncKanbanBoard, stale_task_monitor
-    from kanban.domain import AuditEntry, Stage
-
     hook_calls = []
 
     async def stale_hook(task):
         hook_calls.append(task.id)
 
-    hooks = {"on_stale_task": [stale_hook]}
-    board = AsyncKanbanBoard(persist_path=None, hooks=hooks)
+    board = hooks_board(on_stale_task=[stale_hook])
 
     task = await board.create_task("Stale Task", "Will become stale")
     await board.move_to_in_progress(task.id)
 
     # Manually set the transition time to be old
-    for entry in reversed(task.history):
-        if entry.to_stage == Stage.IN_PROGRESS:
-            old_time = datetime.now(timezone.utc).timestamp() - 2
-            task.history.remove(entry)
-            task.history.append(
-                AuditEntry(
-                    from_stage=entry.from_stage,
-                    to_stage=entry.to_stage,
-                    timestamp=datetime.fromtimestamp(
-                        old_time, tz=timezone.utc
-                    ).isoformat(),
-                    note=entry.note,
-                )
-            )
-            break
-
-    # Start monitor with fast threshold and 1 second poll interval
-    monitor = asyncio.create_task(
-        stale_task_monitor(board, threshold_seconds=1, poll_interval_seconds=1)
-    )
-    await asyncio.sleep(2)  # Wait for at least one poll cycle
-    monitor.cancel()
+    backdate_in_progress(task, 2)
 
-    try:
-        await monitor
-    except asyncio.CancelledError:
+    # One monitor poll with a fast threshold
+    await check_stale_tasks(board, threshold_seconds=1)
+
+    assert hook_calls == [task.id]
+
+
+@pytest.mark.asyncio
+async def test_hooks_for_same_event_run_concurrently():
+    """Slow hooks overlap instead of running back to back."""
+    registry = HookRegistry()
+    running = []
+    overlap = []
+
+    async def slow_hook(task):
+        running.append(task.id)
+        overlap.append(len(running))
+        await asyncio.sleep(0)
+        running.remove(task.id)
+
+    registry.register("on_transition", slow_hook)
+    registry.register("on_transition", slow_hook)
+
+    await registry.fire("on_transition", Task(title="Test", description="Test"))
+
+    assert overlap == [1, 2]
+
+
+def test_hook_registry_has():
+    """Test has() reports only events with registered hooks."""
+    registry = HookRegistry()
+
+    async def my_hook(task):
         pass
 
-    assert len(hook_calls) >= 1
-    assert task.id in hook_calls
+    assert not registry.has("on_done")
+    registry.register("on_done", my_hook)
+    assert registry.has("on_done")
+    assert not registry.has("on_transition")
+    assert not registry.has("unknown_event")
@@ -0,0 +1,130 @@
+"""Tests for kanban.persistence.JournalStore."""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from kanban.board import AsyncKanbanBoard
+from kanban.domain import Stage
+from kanban.persistence import JournalStore
+
+
+@pytest.fixture
+def store_path(tmp_path):
+    return tmp_path / "board.json"
+
+
+def test_journal_replays_over_snapshot(store_path):
+    """Test load applies journal records on top of the snapshot, last one wins."""
+    store = JournalStore(store_path)
+    store.compact({"a": {"id": "a", "stage": "backlog"}})
+    store.append([{"id": "a", "stage": "in_progress"}, {"id": "b", "stage": "backlog"}])
+    store.append([{"id": "a", "stage": "review"}])
+
+    data = JournalStore(store_path).load()
+
+    assert data == {
+        "a": {"id": "a", "stage": "review"},
+        "b": {"id": "b", "stage": "backlog"},
+    }
+
+
+def test_compact_folds_journal_into_snapshot(store_path):
+    """Test compaction rewrites the snapshot and removes the journal."""
+    store = JournalStore(store_path, compact_every=2)
+    store.append([{"id": "a", "n": 1}, {"id": "a", "n": 2}])
+    assert store.should_compact
+
+    store.compact(store.load())
+
+    assert not store.journal_path.exists()
+    assert not store.should_compact
+    assert JournalStore(store_path).load() == {"a": {"id": "a", "n": 2}}
+
+
+def test_torn_journal_tail_is_ignored(store_path):
+    """Test a partially written last line does not break loading."""
+    store = JournalStore(store_path)
+    store.append([{"id": "a", "n": 1}])
+    with open(store.journal_path, "ab") as f:
+        f.write(b'{"id": "a", "n"')
+
+    assert JournalStore(store_path).load() == {"a": {"id": "a", "n": 1}}
+
+
+@pytest.mark.asyncio
+async def test_appends_after_torn_tail_survive_restart(store_path):
+    """Test writes made after recovering from a torn tail are not lost."""
+    board = AsyncKanbanBoard(persist_path=store_path)
+    t1 = await board.create_task("T1", "Before the crash")
+    with open(board._store.journal_path, "ab") as f:
+        f.write(b'{"id": "t2", "title"')
+
+    recovered = AsyncKanbanBoard(persist_path=store_path)
+    t3 = await recovered.create_task("T3", "After the crash")
+
+    restarted = AsyncKanbanBoard(persist_path=store_path)
+    assert {t.id for t in restarted.all_tasks()} == {t1.id, t3.id}
+
+
+@pytest.mark.asyncio
+async def test_board_appends_only_changed_tasks(store_path):
+    """Test a mutation journals the one task it touched, not the whole board."""
+    board = AsyncKanbanBoard(persist_path=store_path)
+    t1 = await board.create_task("T1", "D1")
+    await board.create_task("T2", "D2")
+    size_before = board._store.journal_path.stat().st_size
+
+    await board.move_to_in_progress(t1.id)
+
+    appended = board._store.journal_path.read_bytes()[size_before:].splitlines()
+    assert appended and all(t1.id.encode() in line for line in appended)
+
+    reloaded = AsyncKanbanBoard(persist_path=store_path)
+    assert reloaded.get_task(t1.id).stage == Stage.IN_PROGRESS
+    assert reloaded.get_task(t1.id).code_snippet is not None
+
+
+@pytest.mark.asyncio
+async def test_board_compacts_after_threshold(store_path):
+    """Test the board snapshots itself once the journal is long enough."""
+    board = AsyncKanbanBoard(persist_path=store_path)
+    board._store.compact_every = 3
+
+    tasks = [await board.create_task(f"T{i}", f"D{i}") for i in range(4)]
+
+    assert store_path.exists()
+    reloaded = AsyncKanbanBoard(persist_path=store_path)
+    assert {t.id for t in reloaded.all_tasks()} == {t.id for t in tasks}
+
+
+@pytest.mark.asyncio
+async def test_only_durable_changes_are_fsynced(store_path, monkeypatch):
+    """Test routine moves skip fsync and a burst of approvals shares one or two."""
+    from kanban import persistence
+
+    fsyncs = []
+    monkeypatch.setattr(persistence.os, "fsync", lambda fd: fsyncs.append(fd))
+
+    async def instant_assistant(description):
+        return "# code"
+
+    board = AsyncKanbanBoard(
+        assistant=instant_assistant, wip_limit=20, persist_path=store_path
+    )
+    tasks = await asyncio.gather(
+        *(board.create_task(f"T{i}", f"D{i}") for i in range(20))
+    )
+    for t in tasks:
+        await board.move_to_in_progress(t.id)
+        await board.move_to_review(t.id)
+    assert fsyncs == []
+
+    await asyncio.gather(*(board.approve(t.id) for t in tasks))
+
+    assert 1 <= len(fsyncs) <= 2
+    reloaded = AsyncKanbanBoard(persist_path=store_path)
+    assert all(t.stage == Stage.DONE for t in reloaded.all_tasks())